@@ -39,7 +39,7 @@ Usage:
     camera.close()
 """
 
-from .api.camera_controller import CameraController
+from .api.camera_controller import CameraController, CameraInfo
 from .api.capture_api import CaptureAPI
 from .api.preview_api import PreviewAPI
 from .api.encoding_api import EncodingAPI
@@ -49,6 +49,7 @@ __author__ = "PiCamera2 Team"
 
 __all__ = [
     'CameraController',
+    'CameraInfo',
     'CaptureAPI',
     'PreviewAPI',
     'EncodingAPI',
@@ -5,13 +5,14 @@ This module contains easy-to-use API classes that provide simplified access
 to camera functionality without exposing the complex underlying implementation.
 """
 
-from .camera_controller import CameraController
+from .camera_controller import CameraController, CameraInfo
 from .capture_api import CaptureAPI
 from .preview_api import PreviewAPI
 from .encoding_api import EncodingAPI
 
 __all__ = [
     'CameraController',
+    'CameraInfo',
     'CaptureAPI',
     'PreviewAPI',
     'EncodingAPI',
@@ -39,10 +39,11 @@ Usage:
         pass
 """
 
-from ..core import CameraCore, ConfigurationManager
+import json
 import logging
 import time
 import threading
+from dataclasses import asdict, dataclass, fields
 from typing import Dict, Any, Optional, List, Tuple
 
 # Import original PiCamera2 functionality
@@ -56,6 +57,59 @@ from .encoding_api import EncodingAPI
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Window in which set_control_deferred() calls are merged into one set_controls()
+CONTROL_COALESCE_WINDOW = 0.016
+
+# orjson is optional; fall back to the standard library encoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _to_json(data: Any) -> str:
+    """Serialize data to a compact JSON string"""
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data, default=str, separators=(',', ':'))
+
+
+@dataclass(frozen=True, slots=True)
+class CameraInfo:
+    """
+    Static camera information, captured once when the camera is initialized
+    
+    Supports the dictionary-style reads of the dict camera_info used to
+    return: info['camera_name'], 'sensor' in info and info.get('id').
+    """
+    id: int
+    camera_name: str
+    resolution: Tuple[int, int]
+    sensor: str
+    properties: Dict[str, Any]
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dictionary-style field access, e.g. info.get('camera_name')"""
+        return getattr(self, key, default) if key in _CAMERA_INFO_FIELDS else default
+    
+    def __getitem__(self, key: str) -> Any:
+        """Dictionary-style field access, e.g. info['camera_name']"""
+        if key not in _CAMERA_INFO_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __contains__(self, key: object) -> bool:
+        """Check for a field by name, e.g. 'sensor' in info"""
+        return key in _CAMERA_INFO_FIELDS
+    
+    def keys(self) -> Tuple[str, ...]:
+        """Get the field names, as dict.keys() did"""
+        return _CAMERA_INFO_FIELDS
+
+
+# Field names of CameraInfo, for its dictionary-style access
+_CAMERA_INFO_FIELDS = tuple(f.name for f in fields(CameraInfo))
+
 
 class CameraController:
     """
@@ -63,6 +117,25 @@ class CameraController:
     Provides a simplified API for common camera operations
     """
     
+    __slots__ = (
+        '_camera_num', '_picam2', '_initialized',
+        '_capture_api', '_preview_api', '_encoding_api',
+        '_camera_config', '_camera_info', '_camera_info_dict', '_static_json_prefix',
+        '_max_resolution',
+        '_pending_controls', '_flush_timer', '_controls_lock', '_flush_lock',
+        'capture', 'preview', 'encoding', 'native',
+        '__weakref__',
+    )
+    
+    # API attributes bound by initialize(); the first access before that
+    # initializes the camera through __getattr__
+    _API_ATTRIBUTES = ('capture', 'preview', 'encoding', 'native')
+    
+    capture: CaptureAPI
+    preview: PreviewAPI
+    encoding: EncodingAPI
+    native: Picamera2
+    
     def __init__(self, camera_num: int = 0):
         """
         Initialize camera controller
@@ -79,9 +152,17 @@ class CameraController:
         self._preview_api = None
         self._encoding_api = None
         
-        # Cache for camera data
-        self._camera_info = {}
+        # Cache for camera data (immutable once initialized)
         self._camera_config = {}
+        self._set_camera_info({})
+        
+        # Control updates waiting to be sent to the camera
+        self._pending_controls = {}
+        self._flush_timer = None
+        self._controls_lock = threading.Lock()
+        # Held from taking the queued updates until the camera has them, so
+        # an older batch can never be applied after a newer one
+        self._flush_lock = threading.Lock()
         
         logger.info("CameraController created")
     
@@ -97,7 +178,7 @@ class CameraController:
             return True
         
         try:
-            logger.info(f"Initializing camera {self._camera_num}...")
+            logger.info("Initializing camera %s...", self._camera_num)
             self._picam2 = Picamera2(camera_num=self._camera_num)
             
             # Initialize API components
@@ -105,18 +186,24 @@ class CameraController:
             self._preview_api = PreviewAPI(self._picam2)
             self._encoding_api = EncodingAPI(self._picam2)
             
-            # Get camera information
-            self._camera_info = self._get_camera_info()
+            # Snapshot camera information once; it does not change afterwards
+            self._set_camera_info(dict(self._picam2.camera_properties))
             
             # Configure with defaults
             self._configure_default()
             
+            # Expose the APIs as plain attributes
+            self.capture = self._capture_api
+            self.preview = self._preview_api
+            self.encoding = self._encoding_api
+            self.native = self._picam2
+            
             self._initialized = True
             logger.info("Camera initialized successfully")
             return True
             
         except Exception as e:
-            logger.error(f"Failed to initialize camera: {e}")
+            logger.error("Failed to initialize camera: %s", e)
             self._initialized = False
             return False
     
@@ -125,49 +212,42 @@ class CameraController:
         try:
             # Create a default configuration
             self._picam2.configure()
+            self._capture_api.update_stream_layout()
+            # The cached JSON embeds control limits, which depend on the mode
+            self._static_json_prefix = None
             logger.info("Default configuration applied")
         except Exception as e:
-            logger.error(f"Failed to apply default configuration: {e}")
+            logger.error("Failed to apply default configuration: %s", e)
+    
+    def _set_camera_info(self, props: Dict[str, Any]):
+        """Cache the camera information derived from a properties snapshot"""
+        width, height = props.get('PixelArraySize', (0, 0))
+        self._max_resolution = (width, height)
+        self._camera_info = CameraInfo(
+            id=self._camera_num,
+            camera_name=props.get('Model', 'Unknown'),
+            resolution=self._max_resolution,
+            sensor=props.get('Location', 'Unknown'),
+            properties=props
+        )
+        self._camera_info_dict = asdict(self._camera_info)
+        self._static_json_prefix = None
     
-    def _get_camera_info(self) -> Dict[str, Any]:
+    def _get_camera_info(self) -> CameraInfo:
         """Get camera information"""
-        if not self._picam2:
-            return {}
-        
-        try:
-            info = {
-                'id': self._camera_num,
-                'camera_name': self._picam2.camera_properties.get('Model', 'Unknown'),
-                'resolution': self._get_max_resolution(),
-                'sensor': self._picam2.camera_properties.get('Location', 'Unknown'),
-                'properties': self._picam2.camera_properties
-            }
-            return info
-        except Exception as e:
-            logger.error(f"Failed to get camera info: {e}")
-            return {'error': str(e)}
+        return self._camera_info
     
     def _get_max_resolution(self) -> Tuple[int, int]:
         """Get maximum supported resolution"""
-        if not self._picam2:
-            return (0, 0)
-        
-        try:
-            # Get the largest resolution available
-            streams = self._picam2.camera_config['main'].size
-            return streams
-        except:
-            try:
-                # Try to get from camera properties
-                return (
-                    self._picam2.camera_properties.get('PixelArraySize', (0, 0))[0],
-                    self._picam2.camera_properties.get('PixelArraySize', (0, 0))[1]
-                )
-            except:
-                return (0, 0)
+        return self._max_resolution
     
     @property
-    def camera_info(self) -> Dict[str, Any]:
+    def max_resolution(self) -> Tuple[int, int]:
+        """Get the maximum sensor resolution as (width, height)"""
+        return self._max_resolution
+    
+    @property
+    def camera_info(self) -> CameraInfo:
         """Get camera information"""
         return self._camera_info
     
@@ -176,33 +256,17 @@ class CameraController:
         """Check if camera is initialized"""
         return self._initialized
     
-    @property
-    def capture(self) -> CaptureAPI:
-        """Access the capture API"""
-        if not self._initialized:
-            self.initialize()
-        return self._capture_api
+    def __getattr__(self, name: str):
+        """Initialize the camera on first access to an API attribute"""
+        if name in CameraController._API_ATTRIBUTES:
+            if self._ensure_initialized():
+                return object.__getattribute__(self, name)
+            return None
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
     
-    @property
-    def preview(self) -> PreviewAPI:
-        """Access the preview API"""
-        if not self._initialized:
-            self.initialize()
-        return self._preview_api
-    
-    @property
-    def encoding(self) -> EncodingAPI:
-        """Access the encoding API"""
-        if not self._initialized:
-            self.initialize()
-        return self._encoding_api
-    
-    @property
-    def native(self) -> Picamera2:
-        """Access the underlying Picamera2 instance for advanced usage"""
-        if not self._initialized:
-            self.initialize()
-        return self._picam2
+    def _ensure_initialized(self) -> bool:
+        """Initialize the camera if needed, returning True once it is ready"""
+        return self._initialized or self.initialize()
     
     def configure(self, config: Dict[str, Any] = None) -> bool:
         """
@@ -214,21 +278,23 @@ class CameraController:
         Returns:
             bool: True if configured successfully
         """
-        if not self._initialized:
-            if not self.initialize():
-                return False
+        if not self._ensure_initialized():
+            return False
         
         try:
             if config:
                 # Custom configuration
                 self._picam2.configure(config)
+                self._capture_api.update_stream_layout()
+                # The cached JSON embeds control limits, which depend on the mode
+                self._static_json_prefix = None
             else:
                 # Default configuration
                 self._configure_default()
             
             return True
         except Exception as e:
-            logger.error(f"Failed to configure camera: {e}")
+            logger.error("Failed to configure camera: %s", e)
             return False
     
     def start(self) -> bool:
@@ -238,15 +304,14 @@ class CameraController:
         Returns:
             bool: True if started successfully
         """
-        if not self._initialized:
-            if not self.initialize():
-                return False
+        if not self._ensure_initialized():
+            return False
         
         try:
             self._picam2.start()
             return True
         except Exception as e:
-            logger.error(f"Failed to start camera: {e}")
+            logger.error("Failed to start camera: %s", e)
             return False
     
     def stop(self):
@@ -256,10 +321,13 @@ class CameraController:
                 self._picam2.stop()
                 logger.info("Camera stopped")
             except Exception as e:
-                logger.error(f"Error stopping camera: {e}")
+                logger.error("Error stopping camera: %s", e)
     
     def close(self):
         """Close the camera and release resources"""
+        if self._initialized:
+            self.flush_controls()
+            self._capture_api.close()
         self.stop()
         
         if self._picam2 and self._initialized:
@@ -267,10 +335,17 @@ class CameraController:
                 self._picam2.close()
                 logger.info("Camera closed and resources released")
             except Exception as e:
-                logger.error(f"Error closing camera: {e}")
+                logger.error("Error closing camera: %s", e)
+        
+        for name in self._API_ATTRIBUTES:
+            try:
+                delattr(self, name)
+            except AttributeError:
+                pass
         
         self._picam2 = None
         self._initialized = False
+        self._set_camera_info({})
     
     def get_controls(self) -> Dict[str, Any]:
         """
@@ -279,20 +354,22 @@ class CameraController:
         Returns:
             Dict[str, Any]: Dictionary of camera controls
         """
-        if not self._initialized:
-            if not self.initialize():
-                return {}
+        if not self._ensure_initialized():
+            return {}
         
         try:
             return self._picam2.camera_controls
         except Exception as e:
-            logger.error(f"Failed to get camera controls: {e}")
+            logger.error("Failed to get camera controls: %s", e)
             return {}
     
     def set_control(self, control: str, value: Any) -> bool:
         """
         Set camera control value
         
+        The update is sent to the camera before returning, together with
+        any updates still queued by set_control_deferred().
+        
         Args:
             control: Control name
             value: Control value
@@ -300,17 +377,62 @@ class CameraController:
         Returns:
             bool: True if set successfully
         """
-        if not self._initialized:
-            if not self.initialize():
-                return False
+        if not self._ensure_initialized():
+            return False
         
-        try:
-            controls = {control: value}
-            self._picam2.set_controls(controls)
-            return True
-        except Exception as e:
-            logger.error(f"Failed to set camera control {control}: {e}")
+        with self._controls_lock:
+            self._pending_controls[control] = value
+        return self.flush_controls()
+    
+    def set_control_deferred(self, control: str, value: Any) -> bool:
+        """
+        Queue a camera control update
+        
+        Updates queued within a short window are merged and sent to the
+        camera together; call flush_controls() to apply them immediately.
+        
+        Args:
+            control: Control name
+            value: Control value
+            
+        Returns:
+            bool: True if the update was queued
+        """
+        if not self._ensure_initialized():
             return False
+        
+        with self._controls_lock:
+            self._pending_controls[control] = value
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(CONTROL_COALESCE_WINDOW, self.flush_controls)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        
+        return True
+    
+    def flush_controls(self) -> bool:
+        """
+        Send any queued control updates to the camera now
+        
+        Returns:
+            bool: True if the controls were set successfully
+        """
+        with self._flush_lock:
+            with self._controls_lock:
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+                controls, self._pending_controls = self._pending_controls, {}
+            
+            if not controls:
+                return True
+            
+            try:
+                self._picam2.set_controls(controls)
+                return True
+            except Exception as e:
+                logger.error("Failed to set camera controls %s: %s", list(controls), e)
+                return False
     
     def get_all_data(self) -> Dict[str, Any]:
         """
@@ -319,12 +441,11 @@ class CameraController:
         Returns:
             Dict[str, Any]: Dictionary with all camera data
         """
-        if not self._initialized:
-            if not self.initialize():
-                return {"error": "Camera not initialized"}
+        if not self._ensure_initialized():
+            return {"error": "Camera not initialized"}
         
         return {
-            "camera_info": self.camera_info,
+            "camera_info": self._camera_info_dict,
             "controls": self.get_controls(),
             "status": "running" if self._picam2 and self._picam2.started else "stopped",
         }
@@ -336,8 +457,16 @@ class CameraController:
         Returns:
             str: JSON string with all camera data
         """
-        import json
-        return json.dumps(self.get_all_data(), indent=2, default=str)
+        if not self._ensure_initialized():
+            return _to_json({"error": "Camera not initialized"})
+        
+        # Serialize the static fields once and splice in the status
+        if self._static_json_prefix is None:
+            static = _to_json({"camera_info": self._camera_info_dict, "controls": self.get_controls()})
+            self._static_json_prefix = static[:-1]
+        
+        status = "running" if self._picam2 and self._picam2.started else "stopped"
+        return self._static_json_prefix + ',"status":"' + status + '"}'
     
     # Context manager support
     def __enter__(self):
@@ -26,17 +26,109 @@ Usage:
     image, metadata = camera.capture.capture_with_metadata()
 """
 
-from ..utils import ImageUtils
 import time
 import logging
 import io
-from typing import Dict, Any, Optional, List, Tuple, Union
-import numpy as np
-from PIL import Image
+import os
+import queue
+import threading
+import weakref
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Dict, Any, Iterator, Optional, List, Tuple, Union
+
+# numpy and PIL are imported on first use so preview-only users do not load them
+if TYPE_CHECKING:
+    import numpy as np
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# JPEG quality used for still captures
+JPEG_QUALITY = 85
+
+# Worker threads used to encode burst frames
+BURST_ENCODE_WORKERS = 3
+
+# Formats capture_burst accepts; 'array' keeps unencoded main stream frames
+BURST_FORMATS = ('jpeg', 'png', 'raw', 'array')
+
+# PIL modes for Picamera2 main stream formats (channel order kept as captured).
+# The padding byte of the 32-bit formats is always 255, so they open as RGBA,
+# which PIL can save as PNG and BMP (RGBX cannot be saved in either)
+PIL_STREAM_MODES = {
+    'RGB888': 'RGB',
+    'BGR888': 'RGB',
+    'XBGR8888': 'RGBA',
+    'XRGB8888': 'RGBA',
+}
+
+# Worker processes used for PNG (zlib) compression of burst frames
+PNG_ENCODE_WORKERS = 2
+
+# Start method for the PNG workers; forking a process that runs camera
+# threads is unsafe, so workers start from a clean interpreter
+PNG_POOL_START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+
+# simplejpeg colorspaces by channel count
+SIMPLEJPEG_COLORSPACES = {3: 'RGB', 4: 'RGBX'}
+
+# Formats Picamera2 can encode and write directly in capture_file
+NATIVE_FILE_FORMATS = ('jpeg', 'png', 'bmp', 'gif')
+
+# Frames buffered between capture and a continuous capture callback
+CONTINUOUS_QUEUE_SIZE = 2
+
+
+def _load_turbojpeg():
+    """
+    Load the libjpeg-turbo encoder if PyTurboJPEG is available
+    
+    Returns:
+        Tuple of (TurboJPEG instance, channel count -> pixel format map),
+        or (None, None) if libjpeg-turbo cannot be loaded
+    """
+    try:
+        from turbojpeg import TurboJPEG, TJPF_RGB, TJPF_RGBX
+        return TurboJPEG(), {3: TJPF_RGB, 4: TJPF_RGBX}
+    except (ImportError, OSError, RuntimeError) as e:
+        logger.debug("TurboJPEG unavailable: %s", e)
+        return None, None
+
+
+def _load_simplejpeg():
+    """
+    Load the simplejpeg module if it is available
+    
+    Returns:
+        simplejpeg module, or None if it is not installed
+    """
+    try:
+        import simplejpeg
+        return simplejpeg
+    except ImportError:
+        return None
+
+
+def _write_file(file_path: str, data: bytes):
+    """Write encoded image data to a file without Python's buffered I/O layer"""
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _png_encode_worker(array: 'np.ndarray') -> bytes:
+    """Encode an image array as PNG (runs in a PNG pool worker process)"""
+    from PIL import Image
+    buffer = io.BytesIO()
+    Image.fromarray(array).save(buffer, format="PNG")
+    return buffer.getvalue()
+
 
 class CaptureAPI:
     """
@@ -44,6 +136,9 @@ class CaptureAPI:
     Provides simplified methods for image capture
     """
     
+    __slots__ = ('_picam2', '_tj', '_tj_formats', '_simplejpeg', '_buffers',
+                 '_png_pool', '_png_pool_lock', '_pil_mode', '_pil_size', '__weakref__')
+    
     def __init__(self, picam2):
         """
         Initialize capture API
@@ -52,8 +147,23 @@ class CaptureAPI:
             picam2: Initialized Picamera2 instance
         """
         self._picam2 = picam2
+        
+        # Cached NEON-accelerated JPEG encoder (None when PIL is used)
+        self._tj, self._tj_formats = _load_turbojpeg()
+        self._simplejpeg = _load_simplejpeg()
+        
+        # Per-thread encode buffers reused across captures
+        self._buffers = threading.local()
+        
+        # PNG compression pool for bursts, created on the first PNG burst
+        self._png_pool = None
+        self._png_pool_lock = threading.Lock()
+        
+        # Main stream layout for building PIL images without inference
+        self._pil_mode = None
+        self._pil_size = None
     
-    def capture_image(self, format: str = 'jpeg', config: Dict = None) -> Union[np.ndarray, bytes]:
+    def capture_image(self, format: str = 'jpeg', config: Dict = None) -> 'Union[np.ndarray, bytes]':
         """
         Capture a single image
         
@@ -65,7 +175,7 @@ class CaptureAPI:
             Image data as numpy array or bytes
         """
         try:
-            logger.info(f"Capturing {format} image")
+            logger.debug("Capturing %s image", format)
             
             # Handle format-specific captures
             if format.lower() == 'jpeg':
@@ -76,43 +186,120 @@ class CaptureAPI:
                 return self.capture_raw()
             else:
                 # Default to numpy array for other formats
-                return self._picam2.capture_array()
+                return self._capture_request_once()[0]
                 
         except Exception as e:
-            logger.error(f"Error capturing image: {e}")
+            logger.error("Error capturing image: %s", e)
             return None
     
     def _capture_jpeg(self) -> bytes:
         """Capture a JPEG image"""
         try:
             # Capture as array first
-            array = self._picam2.capture_array()
-            
-            # Convert to JPEG
-            img = Image.fromarray(array)
-            buffer = io.BytesIO()
-            img.save(buffer, format="JPEG")
-            return buffer.getvalue()
+            array, _ = self._capture_request_once()
+            return self._encode_jpeg(array)
         except Exception as e:
-            logger.error(f"Error capturing JPEG: {e}")
+            logger.error("Error capturing JPEG: %s", e)
             return bytes()
     
+    def _encode_jpeg(self, array: 'np.ndarray') -> bytes:
+        """Encode an image array as JPEG"""
+        # Encode with libjpeg-turbo when available
+        if self._tj is not None:
+            pixel_format = self._tj_formats.get(array.shape[-1] if array.ndim == 3 else 0)
+            if pixel_format is not None:
+                return self._tj.encode(array, quality=JPEG_QUALITY, pixel_format=pixel_format)
+        
+        # Otherwise call straight into libjpeg-turbo through simplejpeg
+        if self._simplejpeg is not None:
+            colorspace = SIMPLEJPEG_COLORSPACES.get(array.shape[-1] if array.ndim == 3 else 0)
+            if colorspace is not None:
+                return self._simplejpeg.encode_jpeg(array, quality=JPEG_QUALITY, colorspace=colorspace,
+                                                    colorsubsampling='420', fastdct=True)
+        
+        # Fall back to PIL; JPEG has no alpha, so drop the padding channel
+        image = self._to_pil(array)
+        if image.mode == 'RGBA':
+            image = image.convert('RGB')
+        buffer = self._encode_buffer()
+        image.save(buffer, format="JPEG", quality=JPEG_QUALITY)
+        return buffer.getvalue()
+    
     def _capture_png(self) -> bytes:
         """Capture a PNG image"""
         try:
             # Capture as array first
-            array = self._picam2.capture_array()
-            
-            # Convert to PNG
-            img = Image.fromarray(array)
-            buffer = io.BytesIO()
-            img.save(buffer, format="PNG")
-            return buffer.getvalue()
+            array, _ = self._capture_request_once()
+            return self._encode_png(array)
         except Exception as e:
-            logger.error(f"Error capturing PNG: {e}")
+            logger.error("Error capturing PNG: %s", e)
             return bytes()
     
-    def capture_raw(self) -> np.ndarray:
+    def _encode_png(self, array: 'np.ndarray') -> bytes:
+        """Encode an image array as PNG in the calling thread"""
+        buffer = self._encode_buffer()
+        self._to_pil(array).save(buffer, format="PNG")
+        return buffer.getvalue()
+    
+    def _encode_png_pooled(self, array: 'np.ndarray') -> bytes:
+        """Encode an image array as PNG on the PNG worker pool (burst frames)"""
+        return self._submit_png(array).result()
+    
+    def _submit_png(self, array: 'np.ndarray') -> Future:
+        """Submit an image array for PNG encoding, returning a future for the bytes"""
+        if self._png_pool is None:
+            with self._png_pool_lock:
+                if self._png_pool is None:
+                    pool = ProcessPoolExecutor(max_workers=PNG_ENCODE_WORKERS,
+                                               mp_context=multiprocessing.get_context(PNG_POOL_START_METHOD))
+                    # Shut the workers down with the API even if close() is never called
+                    weakref.finalize(self, pool.shutdown, wait=False)
+                    self._png_pool = pool
+        return self._png_pool.submit(_png_encode_worker, array)
+    
+    def close(self):
+        """Shut down the PNG worker pool"""
+        with self._png_pool_lock:
+            pool, self._png_pool = self._png_pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+    
+    def _to_pil(self, array: 'np.ndarray'):
+        """Wrap an image array in a PIL Image, using the cached stream layout when it matches"""
+        from PIL import Image
+        
+        mode, size = self._pil_mode, self._pil_size
+        if (mode is not None and array.flags.c_contiguous
+                and array.shape[1::-1] == size and array.ndim == 3 and array.shape[2] == len(mode)):
+            return Image.frombuffer(mode, size, array, 'raw', mode, 0, 1)
+        return Image.fromarray(array)
+    
+    def update_stream_layout(self):
+        """
+        Cache the main stream layout after the camera is (re)configured
+        
+        Called by configure_capture and CameraController.configure; frames
+        that do not match the cached layout fall back to Image.fromarray.
+        """
+        try:
+            main = self._picam2.camera_config['main']
+            self._pil_mode = PIL_STREAM_MODES.get(main['format'])
+            self._pil_size = tuple(main['size'])
+        except (AttributeError, KeyError, TypeError):
+            self._pil_mode = None
+            self._pil_size = None
+    
+    def _encode_buffer(self) -> io.BytesIO:
+        """Get the calling thread's encode buffer, emptied for reuse"""
+        buffer = getattr(self._buffers, 'buffer', None)
+        if buffer is None:
+            buffer = self._buffers.buffer = io.BytesIO()
+        else:
+            buffer.seek(0)
+            buffer.truncate()
+        return buffer
+    
+    def capture_raw(self) -> 'np.ndarray':
         """
         Capture a raw image
         
@@ -120,13 +307,72 @@ class CaptureAPI:
             Raw image data as numpy array
         """
         try:
-            logger.info("Capturing raw image")
-            return self._picam2.capture_array("raw")
+            logger.debug("Capturing raw image")
+            return self._capture_request_once("raw")[0]
         except Exception as e:
-            logger.error(f"Error capturing raw image: {e}")
+            logger.error("Error capturing raw image: %s", e)
             return None
     
-    def capture_with_metadata(self, format: str = 'jpeg') -> Tuple[Union[np.ndarray, bytes], Dict[str, Any]]:
+    @contextmanager
+    def capture_raw_view(self) -> Iterator[memoryview]:
+        """
+        Capture a raw image and expose its buffer without copying
+        
+        The view maps the camera buffer directly and is only valid inside
+        the with block; the request is returned to the camera on exit.
+        
+        Usage:
+            with camera.capture.capture_raw_view() as raw:
+                stream.write(raw)
+        
+        Yields:
+            Read-only memoryview over the raw frame bytes
+        """
+        from picamera2 import MappedArray
+        
+        logger.debug("Capturing raw image view")
+        request = self._picam2.capture_request()
+        try:
+            with MappedArray(request, "raw", reshape=False, write=False) as mapped:
+                view = memoryview(mapped.array)
+                try:
+                    yield view
+                finally:
+                    view.release()
+        finally:
+            request.release()
+    
+    def _capture_request_once(self, stream: str = "main") -> 'Tuple[np.ndarray, Dict[str, Any]]':
+        """
+        Capture one request and take both the frame and its metadata from it
+        
+        Args:
+            stream: Stream to read the frame from ('main', 'lores' or 'raw')
+            
+        Returns:
+            Tuple of (frame array, metadata)
+        """
+        request = self._picam2.capture_request()
+        try:
+            return request.make_array(stream), request.get_metadata()
+        finally:
+            request.release()
+    
+    def _encoder(self, fmt: str, pooled: bool = False):
+        """
+        Get the encode function for a compressed format, or None for array formats
+        
+        Args:
+            fmt: Lower-case image format
+            pooled: Compress PNGs on the worker process pool (bursts only)
+        """
+        if fmt == 'jpeg':
+            return self._encode_jpeg
+        if fmt == 'png':
+            return self._encode_png_pooled if pooled else self._encode_png
+        return None
+    
+    def capture_with_metadata(self, format: str = 'jpeg') -> 'Tuple[Union[np.ndarray, bytes], Dict[str, Any]]':
         """
         Capture an image with metadata
         
@@ -137,59 +383,163 @@ class CaptureAPI:
             Tuple of (image data, metadata)
         """
         try:
-            logger.info(f"Capturing {format} image with metadata")
+            logger.debug("Capturing %s image with metadata", format)
             
-            # Capture request with metadata
-            request = self._picam2.capture_request()
+            # Frame and metadata come from the same request
+            fmt = format.lower()
+            array, metadata = self._capture_request_once("raw" if fmt == 'raw' else "main")
             
-            # Extract image based on format
-            if format.lower() == 'jpeg':
-                img_data = request.make_buffer("main")
-            elif format.lower() == 'raw':
-                img_data = request.make_array("raw")
-            else:
-                img_data = request.make_array("main")
-            
-            # Extract metadata
-            metadata = request.get_metadata()
-            
-            # Release request
-            request.release()
-            
-            return img_data, metadata
+            # Encode compressed formats, return arrays for the rest
+            encode = self._encoder(fmt)
+            return (encode(array) if encode else array), metadata
             
         except Exception as e:
-            logger.error(f"Error capturing image with metadata: {e}")
+            logger.error("Error capturing image with metadata: %s", e)
             return None, {}
     
-    def capture_burst(self, count: int = 5, interval: float = 0.0, format: str = 'jpeg') -> List[Union[np.ndarray, bytes]]:
+    def capture_burst(self, count: int = 5, interval: float = 0.0, format: str = 'jpeg') -> 'List[Union[np.ndarray, bytes]]':
         """
         Capture a burst of images
         
         Args:
             count: Number of images to capture
             interval: Time interval between captures (seconds)
-            format: Image format
+            format: Image format ('jpeg', 'png', 'raw', or 'array' for
+                unencoded main stream frames)
             
         Returns:
-            List of captured images
+            List of captured images; only the images captured before an error
         """
         images = []
         
+        fmt = format.lower()
+        if fmt not in BURST_FORMATS:
+            logger.error("Unsupported burst format: %s", format)
+            return images
+        
         try:
-            logger.info(f"Capturing burst of {count} images")
+            logger.info("Capturing burst of %d images", count)
             
-            for i in range(count):
-                images.append(self.capture_image(format))
-                if i < count - 1 and interval > 0:
-                    time.sleep(interval)
+            # Pick the stream and the encode stage for the requested format
+            stream = "raw" if fmt == 'raw' else "main"
+            encode = self._encoder(fmt, pooled=True)
             
+            self._run_burst(count, interval, stream, encode, results=images)
             return images
             
         except Exception as e:
-            logger.error(f"Error during burst capture: {e}")
+            logger.error("Error during burst capture: %s", e)
             return images
     
+    def capture_burst_to_files(self, file_paths: List[str], interval: float = 0.0,
+                               format: str = 'jpeg') -> bool:
+        """
+        Capture a burst of images straight to files
+        
+        Each frame is encoded and written on a worker thread while the
+        following frames are still being captured.
+        
+        Args:
+            file_paths: Path to save each image to (one capture per path)
+            interval: Time interval between captures (seconds)
+            format: Image format ('jpeg' or 'png')
+            
+        Returns:
+            bool: True if all images were written
+        """
+        try:
+            logger.info("Capturing burst of %d images to files", len(file_paths))
+            
+            encode = self._encoder(format.lower(), pooled=True)
+            if encode is None:
+                logger.error("Unsupported burst file format: %s", format)
+                return False
+            
+            def save(index: int, array: 'np.ndarray'):
+                _write_file(file_paths[index], encode(array))
+            
+            self._run_burst(len(file_paths), interval, "main", save, with_index=True)
+            return True
+            
+        except Exception as e:
+            logger.error("Error during burst capture to files: %s", e)
+            return False
+    
+    def _run_burst(self, count: int, interval: float, stream: str, process=None,
+                   with_index: bool = False, results: Optional[List[Any]] = None) -> List[Any]:
+        """
+        Capture count frames and process them on a worker pool as they arrive
+        
+        Args:
+            count: Number of frames to keep
+            interval: Time interval between kept frames (seconds)
+            stream: Stream to capture from
+            process: Function applied to each kept frame, or None to keep the arrays
+            with_index: Pass the frame index to process as the first argument
+            results: List to append the kept frames to; it holds the frames
+                captured so far if the burst fails part way
+            
+        Returns:
+            List of processed frames in capture order; when process is None,
+            views of the frames, which share one contiguous buffer
+        """
+        if results is None:
+            results = []
+        
+        # Express the interval as frames to skip instead of sleeping
+        skip = self._frames_per_interval(interval)
+        
+        if skip:
+            # Let the skipped frames pass without copying them
+            def kept_frames():
+                for i in range(count):
+                    if i:
+                        for _ in range(skip):
+                            self._picam2.capture_request().release()
+                    arrays, _ = self._picam2.capture_arrays([stream])
+                    yield arrays[0]
+            frames = kept_frames()
+        else:
+            # Queue every capture up front so the sensor is never left idle
+            jobs = [self._picam2.capture_arrays([stream], wait=False) for _ in range(count)]
+            frames = (self._picam2.wait(job)[0][0] for job in jobs)
+        
+        # Process completed frames in the background while later ones arrive
+        pending = []
+        buffer = None
+        with ThreadPoolExecutor(max_workers=BURST_ENCODE_WORKERS) as pool:
+            try:
+                for i, array in enumerate(frames):
+                    if process is None:
+                        # Keep unprocessed frames in one contiguous buffer
+                        if buffer is None:
+                            import numpy as np
+                            buffer = np.empty((count,) + array.shape, dtype=array.dtype)
+                        buffer[i] = array
+                        pending.append(buffer[i])
+                    elif with_index:
+                        pending.append(pool.submit(process, i, array))
+                    else:
+                        pending.append(pool.submit(process, array))
+            finally:
+                # Hand back everything captured so far, in capture order
+                for item in pending:
+                    results.append(item.result() if isinstance(item, Future) else item)
+        
+        return results
+    
+    def _frames_per_interval(self, interval: float) -> int:
+        """Convert a capture interval in seconds to a number of sensor frames"""
+        if interval <= 0:
+            return 0
+        
+        frame_duration = self._picam2.capture_metadata().get('FrameDuration', 0)
+        if not frame_duration:
+            return 0
+        
+        # FrameDuration is reported in microseconds
+        return max(0, round(interval * 1e6 / frame_duration) - 1)
+    
     def capture_to_file(self, file_path: str, format: str = 'jpeg') -> bool:
         """
         Capture an image directly to file
@@ -202,63 +552,107 @@ class CaptureAPI:
             bool: True if successful
         """
         try:
-            logger.info(f"Capturing image to file: {file_path}")
+            logger.debug("Capturing image to file: %s", file_path)
+            
+            # Let Picamera2 encode and write formats it supports natively
+            if format.lower() in NATIVE_FILE_FORMATS:
+                self._picam2.capture_file(file_path, name="main", format=format.lower())
+                return True
             
+            # Other formats are captured as arrays and saved through PIL
             image = self.capture_image(format)
             
             if image is not None:
-                if isinstance(image, bytes):
-                    # Save bytes directly
-                    with open(file_path, 'wb') as f:
-                        f.write(image)
-                else:
-                    # Save numpy array
-                    img = Image.fromarray(image)
-                    img.save(file_path)
-                
+                img = self._to_pil(image)
+                img.save(file_path)
                 return True
             else:
                 return False
                 
         except Exception as e:
-            logger.error(f"Error capturing to file: {e}")
+            logger.error("Error capturing to file: %s", e)
             return False
     
-    def capture_continuous(self, count: int, interval: float = 1.0, callback=None) -> List[np.ndarray]:
+    def capture_continuous(self, count: int, interval: float = 1.0, callback=None) -> 'List[np.ndarray]':
         """
         Continuously capture images with callback
         
+        When a callback is given it runs on a worker thread fed through a
+        bounded queue, so a slow callback drops frames instead of delaying
+        the capture schedule.
+        
         Args:
             count: Number of images to capture
             interval: Time interval between captures (seconds)
             callback: Function to call for each image
             
         Returns:
-            List of captured images (if no callback)
+            List of captured images (if no callback), as views of one
+            contiguous buffer; only the images captured before an error
         """
         images = []
+        captured = 0
+        frames = queue.Queue(maxsize=CONTINUOUS_QUEUE_SIZE)
+        consumer = None
+        dropped = 0
         
         try:
-            logger.info(f"Starting continuous capture for {count} images")
+            logger.info("Starting continuous capture for %d images", count)
             
+            if callback:
+                consumer = threading.Thread(target=self._continuous_consumer,
+                                            args=(frames, callback), daemon=True)
+                consumer.start()
+            
+            next_capture = time.monotonic()
             for i in range(count):
                 img = self._picam2.capture_array()
                 
                 if callback:
-                    # Call the callback with the image
-                    callback(img, i)
+                    # Hand the image to the consumer, dropping it if it is behind
+                    try:
+                        frames.put_nowait((img, i))
+                    except queue.Full:
+                        dropped += 1
                 else:
-                    # Store the image
-                    images.append(img)
+                    # Store the images in one contiguous buffer
+                    if i == 0:
+                        import numpy as np
+                        images = np.empty((count,) + img.shape, dtype=img.dtype)
+                    images[i] = img
+                captured = i + 1
                 
                 if i < count - 1:
-                    time.sleep(interval)
+                    next_capture += interval
+                    delay = next_capture - time.monotonic()
+                    if delay > 0:
+                        time.sleep(delay)
             
-            return images
+            return list(images)
             
         except Exception as e:
-            logger.error(f"Error during continuous capture: {e}")
-            return images
+            logger.error("Error during continuous capture: %s", e)
+            return list(images[:captured])
+        
+        finally:
+            if consumer is not None:
+                frames.put(None)
+                consumer.join()
+                if dropped:
+                    logger.warning("Continuous capture dropped %d frames", dropped)
+            logger.info("Continuous capture finished after %d images", captured)
+    
+    @staticmethod
+    def _continuous_consumer(frames: queue.Queue, callback):
+        """Run the continuous capture callback until the end marker arrives"""
+        while True:
+            item = frames.get()
+            if item is None:
+                break
+            try:
+                callback(*item)
+            except Exception as e:
+                logger.error("Error in continuous capture callback: %s", e)
     
     def configure_capture(self, config: Dict[str, Any]) -> bool:
         """
@@ -272,7 +666,8 @@ class CaptureAPI:
         """
         try:
             self._picam2.configure(config)
+            self.update_stream_layout()
             return True
         except Exception as e:
-            logger.error(f"Error configuring capture: {e}")
+            logger.error("Error configuring capture: %s", e)
             return False
@@ -24,15 +24,109 @@ Usage:
     )
 """
 
-import time
 import logging
 import os
-from typing import Dict, Any, Optional, List, Union
+import importlib
+import importlib.util
+import functools
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Tuple, Union
 import threading
 
+from ..core.guard import _guard
+from .capture_api import _load_turbojpeg, _write_file
+
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# V4L2 memory-to-memory H.264 encoder node of the VideoCore (bcm2835-codec)
+HW_H264_DEVICE = '/dev/video11'
+
+# Picamera2 encoder classes by encoder type, imported once on first use
+_ENCODER_NAMES = {
+    'h264': 'H264Encoder',
+    'mjpeg': 'MJPEGEncoder',
+    'libav': 'LibavH264Encoder',
+}
+_ENCODER_CLASSES = {}
+
+# libx264 presets per quality tier for the software (libav) encoder
+LIBAV_PRESETS = {
+    'low': 'ultrafast',
+    'medium': 'superfast',
+    'high': 'veryfast',
+}
+
+# Constant-quality (CRF-style) quantizers per quality tier; lower is better
+QUALITY_CRF = {
+    'low': 28,
+    'medium': 23,
+    'high': 18,
+}
+
+# Default MJPEG encoder quality per quality tier; an explicit mjpeg_q
+# option (1-100) overrides it
+MJPEG_QUALITY = {
+    'low': 75,
+    'medium': 95,
+    'high': 100,
+}
+
+# Seconds a still waits for the camera thread to latch a recorded frame
+STILL_LATCH_TIMEOUT = 1.0
+
+# Options read by EncodingAPI itself; everything else is passed to the encoder
+CORE_OPTIONS = frozenset(('quality', 'bitrate', 'crf', 'fps', 'encoder_type', 'jpeg_quality', 'mjpeg_q'))
+
+
+def _split_options(options: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Split options into (core configuration, extra encoder kwargs)"""
+    core = {k: v for k, v in options.items() if k in CORE_OPTIONS}
+    extra = {k: v for k, v in options.items() if k not in CORE_OPTIONS}
+    return core, extra
+
+
+def _rate_control(config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Get the H.264 rate control arguments for an encoding configuration
+    
+    A configuration without a bitrate records in constant-quality mode,
+    using its CRF value as the encoder quantizer.
+    """
+    if config.get('bitrate') is None and config.get('crf') is not None:
+        return {'qp': config['crf']}
+    return {'bitrate': config['bitrate']}
+
+
+def _get_encoder(encoder_type: str):
+    """
+    Get a Picamera2 encoder class, importing it only on the first request
+    
+    Raises:
+        ImportError: If the encoder is not available in this installation
+    """
+    cls = _ENCODER_CLASSES.get(encoder_type)
+    if cls is None:
+        encoders = importlib.import_module('picamera2.encoders')
+        try:
+            cls = getattr(encoders, _ENCODER_NAMES[encoder_type])
+        except AttributeError as e:
+            raise ImportError(f"Encoder {_ENCODER_NAMES[encoder_type]} not available") from e
+        _ENCODER_CLASSES[encoder_type] = cls
+    return cls
+
+
+@functools.lru_cache(maxsize=None)
+def _hw_h264_available() -> bool:
+    """Check whether the VideoCore hardware H.264 encoder is present"""
+    return os.path.exists(HW_H264_DEVICE)
+
+
+@functools.lru_cache(maxsize=None)
+def _libav_available() -> bool:
+    """Check whether PyAV is installed for the libav encoders"""
+    return importlib.util.find_spec("av") is not None
+
 
 class EncodingAPI:
     """
@@ -40,6 +134,13 @@ class EncodingAPI:
     Provides simplified methods for video recording and encoding
     """
     
+    __slots__ = ('_picam2', '_recording', '_encoder', '_output', '_recording_file',
+                 '_stop_timer', '_tj', '_tj_formats', '_still_frame',
+                 '_still_wanted', '_still_latched', '_user_post_callback',
+                 '_core_config', '_extra_encoder_kwargs', '_start_executor',
+                 '_start_future', '_encoder_cache', '_encoder_key', '_state_lock',
+                 '__weakref__')
+    
     def __init__(self, picam2):
         """
         Initialize encoding API
@@ -52,16 +153,41 @@ class EncodingAPI:
         self._encoder = None
         self._output = None
         self._recording_file = None
-        self._recording_thread = None
         
-        # Default encoding configuration
-        self._encoding_config = {
+        # Encoders by settings, reused across recordings
+        self._encoder_cache = {}
+        self._encoder_key = None
+        self._stop_timer = None
+        
+        # Serializes stops (manual or timed) with the start callback
+        self._state_lock = threading.Lock()
+        
+        # Encoder bring-up runs on a worker so callers are not blocked by it
+        self._start_executor = None
+        self._start_future: Optional[Future] = None
+        
+        # JPEG encoder for stills captured while recording (None when PIL is used)
+        self._tj, self._tj_formats = _load_turbojpeg()
+        
+        # Frame latched for a still while recording. A still raises the
+        # wanted flag and the camera thread copies the next frame only
+        # then, so frames nobody asked for are never mapped or copied.
+        self._still_frame = None
+        self._still_wanted = False
+        self._still_latched = threading.Event()
+        self._user_post_callback = None
+        
+        # Default encoding configuration, kept apart from encoder kwargs
+        self._core_config = {
             'quality': 'medium',
             'bitrate': 10000000,  # 10 Mbps
+            'crf': 23,
             'fps': 30,
             'encoder_type': 'h264',
         }
+        self._extra_encoder_kwargs = {}
     
+    @_guard("Error starting video recording")
     def start_video_recording(self, output_file: str, 
                              quality: str = None,
                              fps: int = None, 
@@ -77,137 +203,257 @@ class EncodingAPI:
             quality: Recording quality ('low', 'medium', 'high')
             fps: Frames per second
             bitrate: Encoding bitrate
-            encoder_type: Encoder type ('h264', 'mjpeg', 'libav')
+            encoder_type: Encoder type ('h264', 'h264_hw', 'mjpeg', 'libav')
             duration: Recording duration in seconds (None for manual stop)
-            **kwargs: Additional encoder parameters
+            **kwargs: Additional encoder parameters (for 'libav': preset,
+                threads and profile override the per-quality defaults; for
+                'mjpeg': mjpeg_q sets the JPEG quality, clamped to 1-100)
             
         Returns:
-            bool: True if recording started successfully
+            bool: True if recording started successfully. The encoder itself
+                starts in the background; a failure there is logged and
+                clears is_recording, and the duration timer only starts
+                once the encoder is running.
         """
-        if self._recording:
+        if self.is_recording:
             logger.warning("Recording already in progress")
             return False
         
-        try:
-            logger.info(f"Starting video recording to {output_file}")
-            
-            # Prepare configuration
-            config = self._encoding_config.copy()
-            
-            # Override with provided values
-            if quality:
-                config['quality'] = quality
-                
-                # Set bitrate based on quality if not explicitly provided
-                if not bitrate:
-                    if quality == 'low':
-                        config['bitrate'] = 5000000  # 5 Mbps
-                    elif quality == 'high':
-                        config['bitrate'] = 20000000  # 20 Mbps
-            
-            if fps:
-                config['fps'] = fps
-            
-            if bitrate:
-                config['bitrate'] = bitrate
-            
-            if encoder_type:
-                config['encoder_type'] = encoder_type
-            
-            # Add any additional parameters
-            config.update(kwargs)
-            
-            # Select encoder based on type
-            if config['encoder_type'].lower() == 'libav':
-                self._start_libav_recording(output_file, config)
-            elif config['encoder_type'].lower() == 'mjpeg':
-                self._start_mjpeg_recording(output_file, config)
-            else:
-                # Default to H.264
-                self._start_h264_recording(output_file, config)
-            
-            # Set recording state
-            self._recording = True
-            self._recording_file = output_file
-            
-            # Start timed recording if duration specified
-            if duration:
-                self._recording_thread = threading.Thread(
-                    target=self._stop_after_duration,
-                    args=(duration,)
-                )
-                self._recording_thread.daemon = True
-                self._recording_thread.start()
-            
-            return True
+        logger.info("Starting video recording to %s", output_file)
+        
+        # Prepare configuration
+        config = self._core_config.copy()
+        extra = self._extra_encoder_kwargs.copy()
+        
+        # Override with provided values
+        if quality:
+            config['quality'] = quality
             
-        except Exception as e:
-            logger.error(f"Error starting video recording: {e}")
-            return False
-    
-    def _start_h264_recording(self, output_file: str, config: Dict[str, Any]):
-        """Start H.264 video recording with specified config"""
-        from picamera2.encoders import H264Encoder
+            # Record at constant quality if no bitrate is given
+            if not bitrate:
+                config['crf'] = QUALITY_CRF.get(quality, QUALITY_CRF['medium'])
+                config['bitrate'] = None
         
-        # Create encoder
-        self._encoder = H264Encoder(
-            bitrate=config['bitrate'],
-            repeat=True,
-            **{k: v for k, v in config.items() if k not in ['quality', 'bitrate', 'fps', 'encoder_type']}
-        )
+        if fps:
+            config['fps'] = fps
         
-        # Start encoder
+        if bitrate:
+            config['bitrate'] = bitrate
+        
+        if encoder_type:
+            config['encoder_type'] = encoder_type
+        
+        # Add any additional parameters
+        if kwargs:
+            core, more = _split_options(kwargs)
+            config.update(core)
+            extra.update(more)
+        
+        # Select encoder based on type
+        if config['encoder_type'].lower() == 'libav':
+            encoder = self._build_libav_encoder(config, extra)
+        elif config['encoder_type'].lower() == 'mjpeg':
+            encoder = self._build_mjpeg_encoder(config, extra)
+        elif config['encoder_type'].lower() == 'h264_hw':
+            # Hardware encoder only, no software fallback
+            encoder = self._build_h264_encoder(config, extra, software_fallback=False)
+        else:
+            # Default to H.264
+            encoder = self._build_h264_encoder(config, extra)
+        
+        # Set recording state
+        self._encoder = encoder
         self._output = output_file
-        self._picam2.start_recording(self._encoder, self._output)
+        self._recording = True
+        self._recording_file = output_file
+        self._arm_still_buffers()
+        self._begin_recording(duration)
+        
+        return True
     
-    def _start_mjpeg_recording(self, output_file: str, config: Dict[str, Any]):
-        """Start MJPEG video recording with specified config"""
-        from picamera2.encoders import MJPEGEncoder
+    def _build_h264_encoder(self, config: Dict[str, Any], extra: Dict[str, Any],
+                            software_fallback: bool = True):
+        """Build an H.264 encoder for the VideoCore hardware encoder"""
+        if software_fallback and not _hw_h264_available() and _libav_available():
+            logger.warning("Hardware H.264 encoder not found. Falling back to LibavH264Encoder")
+            return self._build_libav_encoder(config, extra)
         
-        # Create encoder
-        q = 95
-        if config['quality'] == 'low':
-            q = 75
-        elif config['quality'] == 'high':
-            q = 100
-        
-        self._encoder = MJPEGEncoder(
-            q=q,
-            fps=config['fps'],
-            **{k: v for k, v in config.items() if k not in ['quality', 'bitrate', 'fps', 'encoder_type']}
+        H264Encoder = _get_encoder('h264')
+        
+        iperiod = extra.pop('iperiod', config['fps'])
+        rate = _rate_control(config)
+        
+        # Create encoder (one keyframe per second unless overridden)
+        return self._reuse_encoder(
+            ('h264', iperiod, *rate.items(), *sorted(extra.items())),
+            lambda: H264Encoder(repeat=True, iperiod=iperiod, **rate, **extra)
         )
+    
+    def _build_mjpeg_encoder(self, config: Dict[str, Any], extra: Dict[str, Any]):
+        """Build an MJPEG encoder with specified config"""
+        MJPEGEncoder = _get_encoder('mjpeg')
         
-        # Start encoder
-        self._output = output_file
-        self._picam2.start_recording(self._encoder, self._output)
+        # JPEG quality from the tier table unless set explicitly
+        q = config.get('mjpeg_q', MJPEG_QUALITY.get(config['quality'], MJPEG_QUALITY['medium']))
+        q = max(1, min(100, int(q)))
+        fps = config['fps']
+        
+        # Create encoder
+        return self._reuse_encoder(
+            ('mjpeg', q, fps, *sorted(extra.items())),
+            lambda: MJPEGEncoder(q=q, fps=fps, **extra)
+        )
     
-    def _start_libav_recording(self, output_file: str, config: Dict[str, Any]):
-        """Start LibAV video recording with specified config"""
+    def _build_libav_encoder(self, config: Dict[str, Any], extra: Dict[str, Any]):
+        """Build a LibAV H.264 encoder with specified config"""
         try:
-            import pyav
-            from picamera2.encoders import LibavH264Encoder
+            if not _libav_available():
+                raise ImportError("PyAV not installed")
+            LibavH264Encoder = _get_encoder('libav')
             
-            # Create encoder
-            self._encoder = LibavH264Encoder(
-                bitrate=config['bitrate'],
-                fps=config['fps'],
-                **{k: v for k, v in config.items() if k not in ['quality', 'bitrate', 'fps', 'encoder_type']}
+            preset = extra.pop('preset', LIBAV_PRESETS.get(config['quality'], 'superfast'))
+            threads = extra.pop('threads', os.cpu_count() or 1)
+            profile = extra.pop('profile', 'baseline')
+            fps = config['fps']
+            rate = _rate_control(config)
+            
+            # Create encoder with a low-latency baseline profile
+            encoder = self._reuse_encoder(
+                ('libav', fps, profile, *rate.items(), *sorted(extra.items())),
+                lambda: LibavH264Encoder(framerate=fps, **rate, profile=profile, **extra)
             )
             
-            # Start encoder
-            self._output = output_file
-            self._picam2.start_recording(self._encoder, self._output)
+            # Fast x264 preset for the quality tier, encoding on every core
+            encoder.preset = preset
+            encoder.threads = threads
+            logger.debug("libx264 preset %s with %d threads", encoder.preset, encoder.threads)
+            
+            return encoder
             
         except ImportError:
             logger.error("LibAV encoder requires PyAV package. Falling back to H264Encoder")
-            self._start_h264_recording(output_file, config)
+            return self._build_h264_encoder(config, extra, software_fallback=False)
     
-    def _stop_after_duration(self, duration: float):
-        """Helper method to stop recording after specified duration"""
-        time.sleep(duration)
-        if self._recording:
-            self.stop_video_recording()
+    def _reuse_encoder(self, key: Tuple, factory):
+        """
+        Get the cached encoder for a set of encoder settings
+        
+        Encoders are kept across start/stop cycles so repeated recordings
+        with the same settings skip encoder construction.
+        
+        Args:
+            key: Hashable description of the encoder settings
+            factory: Builds the encoder when none is cached for key
+        """
+        try:
+            encoder = self._encoder_cache.get(key)
+        except TypeError:
+            # Unhashable encoder options; build a fresh encoder every time
+            self._encoder_key = None
+            return factory()
+        
+        if encoder is None:
+            encoder = self._encoder_cache[key] = factory()
+        self._encoder_key = key
+        return encoder
+    
+    def _begin_recording(self, duration: Optional[float] = None):
+        """
+        Start the prepared encoder on the start worker without blocking
+        
+        Args:
+            duration: Seconds after a successful start to stop the recording
+        """
+        if self._start_executor is None:
+            self._start_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="EncoderStart")
+        
+        future = self._start_future = self._start_executor.submit(
+            self._picam2.start_recording, self._encoder, self._output
+        )
+        future.add_done_callback(functools.partial(self._on_recording_started, duration=duration))
+    
+    def _on_recording_started(self, future: Future, duration: Optional[float] = None):
+        """Arm the duration timer once the encoder runs, or undo a failed start"""
+        error = future.exception()
+        with self._state_lock:
+            # A stop already took this recording over
+            if future is not self._start_future:
+                return
+            
+            if error is None:
+                # Start timed recording if duration specified
+                if duration:
+                    self._stop_timer = threading.Timer(duration, self.stop_video_recording)
+                    self._stop_timer.daemon = True
+                    self._stop_timer.start()
+                return
+            
+            logger.error("Error starting video recording: %s", error)
+            # Do not hand out an encoder that failed to start again
+            self._encoder_cache.pop(self._encoder_key, None)
+            self._disarm_still_buffers()
+            
+            # Reset recording state so a new recording can start
+            self._start_future = None
+            self._recording = False
+            self._encoder = None
+            self._output = None
+            self._recording_file = None
+    
+    def _arm_still_buffers(self):
+        """Hook the post callback that latches frames requested by stills"""
+        # Only the libjpeg-turbo still path reads the latched frames
+        if self._tj is None:
+            return
+        
+        self._still_frame = None
+        self._still_wanted = False
+        self._user_post_callback = self._picam2.post_callback
+        self._picam2.post_callback = self._latch_frame
+    
+    def _disarm_still_buffers(self):
+        """Stop latching frames and restore the caller's post callback"""
+        if self._picam2.post_callback == self._latch_frame:
+            self._picam2.post_callback = self._user_post_callback
+        self._user_post_callback = None
+        self._still_frame = None
+        self._still_wanted = False
     
+    def _latch_frame(self, request):
+        """Copy a recorded frame for a waiting still (camera thread)"""
+        if self._user_post_callback is not None:
+            self._user_post_callback(request)
+        
+        # Nothing to do unless a still asked for a frame
+        if not self._still_wanted:
+            return
+        
+        from picamera2 import MappedArray
+        with MappedArray(request, "main") as mapped:
+            frame = self._still_frame
+            if frame is None or frame.shape != mapped.array.shape:
+                frame = self._still_frame = mapped.array.copy()
+            else:
+                frame[...] = mapped.array
+        
+        self._still_wanted = False
+        self._still_latched.set()
+    
+    def _wait_still_frame(self):
+        """
+        Ask the camera thread for the next recorded frame and wait for it
+        
+        Returns:
+            The latched frame, or None if no frame arrived in time
+        """
+        self._still_latched.clear()
+        self._still_wanted = True
+        if not self._still_latched.wait(STILL_LATCH_TIMEOUT):
+            self._still_wanted = False
+            return None
+        return self._still_frame
+    
+    @_guard("Error stopping video recording")
     def stop_video_recording(self) -> bool:
         """
         Stop video recording
@@ -215,26 +461,36 @@ class EncodingAPI:
         Returns:
             bool: True if recording stopped successfully
         """
-        if not self._recording:
-            logger.warning("No active recording to stop")
-            return False
-        
-        try:
+        # The duration timer can fire while a manual stop runs; the lock
+        # lets only one of them stop the encoder
+        with self._state_lock:
+            if not self._recording:
+                logger.warning("No active recording to stop")
+                return False
+            
             logger.info("Stopping video recording")
             
-            self._picam2.stop_recording()
+            # A manual stop supersedes a pending timed stop
+            if self._stop_timer is not None:
+                self._stop_timer.cancel()
+                self._stop_timer = None
+            
+            # Let a pending encoder start finish before stopping it
+            future, self._start_future = self._start_future, None
+            try:
+                if future is None or future.exception() is None:
+                    self._picam2.stop_recording()
+            finally:
+                self._disarm_still_buffers()
             
             # Reset recording state
             self._recording = False
             self._encoder = None
             self._output = None
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error stopping video recording: {e}")
-            return False
+        
+        return True
     
+    @_guard("Error pausing recording")
     def pause_recording(self) -> bool:
         """
         Pause video recording
@@ -245,14 +501,11 @@ class EncodingAPI:
         if not self._recording:
             return False
         
-        try:
-            logger.info("Pausing recording")
-            self._picam2.stop_encoder()
-            return True
-        except Exception as e:
-            logger.error(f"Error pausing recording: {e}")
-            return False
+        logger.info("Pausing recording")
+        self._picam2.stop_encoder()
+        return True
     
+    @_guard("Error resuming recording")
     def resume_recording(self) -> bool:
         """
         Resume paused recording
@@ -263,14 +516,11 @@ class EncodingAPI:
         if not self._recording:
             return False
         
-        try:
-            logger.info("Resuming recording")
-            self._picam2.start_encoder()
-            return True
-        except Exception as e:
-            logger.error(f"Error resuming recording: {e}")
-            return False
+        logger.info("Resuming recording")
+        self._picam2.start_encoder()
+        return True
     
+    @_guard("Error capturing while recording")
     def capture_while_recording(self, output_file: str) -> bool:
         """
         Capture still image during video recording
@@ -285,32 +535,48 @@ class EncodingAPI:
             logger.warning("No active recording")
             return False
         
-        try:
-            logger.info(f"Capturing still during recording to {output_file}")
-            
-            # Determine format from filename
-            format_name = os.path.splitext(output_file)[1].lower().replace('.', '')
+        logger.info("Capturing still during recording to %s", output_file)
+        
+        # Determine format from filename
+        format_name = os.path.splitext(output_file)[1].lower().replace('.', '')
+        
+        if format_name in ('jpg', 'jpeg'):
+            quality = self._core_config.get('jpeg_quality', 90)
             
-            if format_name in ('jpg', 'jpeg'):
-                array = self._picam2.capture_array()
+            if self._tj is not None:
+                # Latch the next recorded frame from the post callback
+                array = None
+                if self._picam2.post_callback == self._latch_frame:
+                    array = self._wait_still_frame()
+                if array is None:
+                    array = self._picam2.capture_array()
                 
-                from PIL import Image
-                import numpy as np
-                
-                # Convert and save
-                if isinstance(array, np.ndarray):
-                    img = Image.fromarray(array)
-                    img.save(output_file)
+                # Encode with libjpeg-turbo and write without buffered I/O
+                pixel_format = self._tj_formats.get(array.shape[-1])
+                if pixel_format is not None:
+                    _write_file(output_file, self._tj.encode(array, quality=quality, pixel_format=pixel_format))
                     return True
             
-            # Default capture method
-            self._picam2.capture_file(output_file)
+            # Let Picamera2 encode the main stream straight to the file, with
+            # the shared quality option restored afterwards
+            options = self._picam2.options
+            missing = object()
+            previous = options.get('quality', missing)
+            options['quality'] = quality
+            try:
+                self._picam2.capture_file(output_file, name="main", format="jpeg")
+            finally:
+                if previous is missing:
+                    options.pop('quality', None)
+                else:
+                    options['quality'] = previous
             return True
-            
-        except Exception as e:
-            logger.error(f"Error capturing while recording: {e}")
-            return False
+        
+        # Default capture method
+        self._picam2.capture_file(output_file)
+        return True
     
+    @_guard("Error configuring encoding")
     def configure_encoding(self, config: Dict[str, Any]) -> bool:
         """
         Configure encoding settings
@@ -321,17 +587,18 @@ class EncodingAPI:
         Returns:
             bool: True if configured successfully
         """
-        try:
-            logger.info("Updating encoding configuration")
-            self._encoding_config.update(config)
-            return True
-        except Exception as e:
-            logger.error(f"Error configuring encoding: {e}")
-            return False
+        logger.info("Updating encoding configuration")
+        core, extra = _split_options(config)
+        self._core_config.update(core)
+        self._extra_encoder_kwargs.update(extra)
+        return True
     
     @property
     def is_recording(self) -> bool:
-        """Check if currently recording"""
+        """Check if currently recording (including an encoder still starting)"""
+        future = self._start_future
+        if future is not None and future.done() and future.exception() is not None:
+            return False
         return self._recording
     
     @property
@@ -342,8 +609,9 @@ class EncodingAPI:
     @property
     def encoding_config(self) -> Dict[str, Any]:
         """Get current encoding configuration"""
-        return self._encoding_config.copy()
+        return {**self._core_config, **self._extra_encoder_kwargs}
     
+    @_guard("Error setting quality")
     def set_quality(self, quality: str) -> bool:
         """
         Set recording quality
@@ -354,23 +622,15 @@ class EncodingAPI:
         Returns:
             bool: True if quality set successfully
         """
-        if quality not in ('low', 'medium', 'high'):
-            logger.warning(f"Invalid quality: {quality}")
+        if quality not in QUALITY_CRF:
+            logger.warning("Invalid quality: %s", quality)
             return False
         
-        try:
-            self._encoding_config['quality'] = quality
-            
-            # Update bitrate based on quality
-            if quality == 'low':
-                self._encoding_config['bitrate'] = 5000000  # 5 Mbps
-            elif quality == 'medium':
-                self._encoding_config['bitrate'] = 10000000  # 10 Mbps
-            else:  # high
-                self._encoding_config['bitrate'] = 20000000  # 20 Mbps
-                
-            return True
+        self._core_config['quality'] = quality
+        
+        # Switch to constant quality for this tier; configure_encoding
+        # with a bitrate returns to constant-bitrate recording
+        self._core_config['crf'] = QUALITY_CRF[quality]
+        self._core_config['bitrate'] = None
             
-        except Exception as e:
-            logger.error(f"Error setting quality: {e}")
-            return False
+        return True
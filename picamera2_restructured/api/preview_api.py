@@ -25,11 +25,40 @@ Usage:
 
 import time
 import logging
+import importlib
 from typing import Dict, Any, Optional, Tuple, Union
 
+from ..core.guard import _guard
+
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Picamera2 preview classes by preview type, imported once on first use
+_PREVIEW_NAMES = {
+    'qt': 'QtPreview',
+    'null': 'NullPreview',
+    'drm': 'DrmPreview',
+}
+_PREVIEW_CLASSES = {}
+
+
+def _get_preview(preview_type: str):
+    """
+    Get a Picamera2 preview class, importing it only on the first request
+    
+    Raises:
+        ImportError: If the preview is not available in this installation
+    """
+    cls = _PREVIEW_CLASSES.get(preview_type)
+    if cls is None:
+        previews = importlib.import_module('picamera2.previews')
+        try:
+            cls = getattr(previews, _PREVIEW_NAMES[preview_type])
+        except AttributeError as e:
+            raise ImportError(f"Preview {_PREVIEW_NAMES[preview_type]} not available") from e
+        _PREVIEW_CLASSES[preview_type] = cls
+    return cls
+
 
 class PreviewAPI:
     """
@@ -37,6 +66,8 @@ class PreviewAPI:
     Provides simplified methods for camera preview
     """
     
+    __slots__ = ('_picam2', '_preview_active', '_preview_type', '_preview_config', '__weakref__')
+    
     def __init__(self, picam2):
         """
         Initialize preview API
@@ -49,6 +80,7 @@ class PreviewAPI:
         self._preview_type = None
         self._preview_config = {}
     
+    @_guard("Error starting preview")
     def start(self, preview_type: str = "default", **kwargs) -> bool:
         """
         Start camera preview
@@ -60,31 +92,27 @@ class PreviewAPI:
         Returns:
             bool: True if preview started successfully
         """
-        try:
-            logger.info(f"Starting {preview_type} preview")
-            
-            # Stop any existing preview
-            if self._preview_active:
-                self.stop()
-            
-            # Select preview based on type
-            if preview_type.lower() == "qt":
-                return self.start_qt(**kwargs)
-            elif preview_type.lower() == "null":
-                return self.start_null(**kwargs)
-            elif preview_type.lower() == "drm":
-                return self.start_drm(**kwargs)
-            else:
-                # Default preview
-                self._picam2.start_preview(**kwargs)
-                self._preview_active = True
-                self._preview_type = "default"
-                return True
-                
-        except Exception as e:
-            logger.error(f"Error starting preview: {e}")
-            return False
+        logger.info("Starting %s preview", preview_type)
+        
+        # Stop any existing preview
+        if self._preview_active:
+            self.stop()
+        
+        # Select preview based on type
+        if preview_type.lower() == "qt":
+            return self.start_qt(**kwargs)
+        elif preview_type.lower() == "null":
+            return self.start_null(**kwargs)
+        elif preview_type.lower() == "drm":
+            return self.start_drm(**kwargs)
+        else:
+            # Default preview
+            self._picam2.start_preview(**kwargs)
+            self._preview_active = True
+            self._preview_type = "default"
+            return True
     
+    @_guard("Error starting Qt preview")
     def start_qt(self, x: int = 100, y: int = 100, width: int = 640, height: int = 480, window_title: str = "Camera Preview") -> bool:
         """
         Start Qt preview window
@@ -99,37 +127,33 @@ class PreviewAPI:
         Returns:
             bool: True if preview started successfully
         """
-        try:
-            logger.info(f"Starting Qt preview ({width}x{height})")
-            
-            from picamera2.previews import QtPreview
-            
-            # Create Qt preview
-            preview = QtPreview(
-                self._picam2,
-                x=x,
-                y=y,
-                width=width,
-                height=height,
-                window_title=window_title
-            )
-            
-            # Store configuration
-            self._preview_config = {
-                'x': x, 'y': y, 
-                'width': width, 'height': height,
-                'window_title': window_title
-            }
-            
-            self._preview_active = True
-            self._preview_type = "qt"
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error starting Qt preview: {e}")
-            return False
+        logger.info("Starting Qt preview (%sx%s)", width, height)
+        
+        QtPreview = _get_preview('qt')
+        
+        # Create Qt preview
+        preview = QtPreview(
+            self._picam2,
+            x=x,
+            y=y,
+            width=width,
+            height=height,
+            window_title=window_title
+        )
+        
+        # Store configuration
+        self._preview_config = {
+            'x': x, 'y': y, 
+            'width': width, 'height': height,
+            'window_title': window_title
+        }
+        
+        self._preview_active = True
+        self._preview_type = "qt"
+        
+        return True
     
+    @_guard("Error starting null preview")
     def start_null(self) -> bool:
         """
         Start null preview (no visible output)
@@ -137,23 +161,19 @@ class PreviewAPI:
         Returns:
             bool: True if null preview started successfully
         """
-        try:
-            logger.info("Starting null preview")
-            
-            from picamera2.previews import NullPreview
-            
-            # Create null preview
-            preview = NullPreview(self._picam2)
-            
-            self._preview_active = True
-            self._preview_type = "null"
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error starting null preview: {e}")
-            return False
+        logger.info("Starting null preview")
+        
+        NullPreview = _get_preview('null')
+        
+        # Create null preview
+        preview = NullPreview(self._picam2)
+        
+        self._preview_active = True
+        self._preview_type = "null"
+        
+        return True
     
+    @_guard("Error starting DRM preview")
     def start_drm(self) -> bool:
         """
         Start DRM preview (direct rendering)
@@ -161,23 +181,19 @@ class PreviewAPI:
         Returns:
             bool: True if DRM preview started successfully
         """
-        try:
-            logger.info("Starting DRM preview")
-            
-            from picamera2.previews import DrmPreview
-            
-            # Create DRM preview
-            preview = DrmPreview(self._picam2)
-            
-            self._preview_active = True
-            self._preview_type = "drm"
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error starting DRM preview: {e}")
-            return False
+        logger.info("Starting DRM preview")
+        
+        DrmPreview = _get_preview('drm')
+        
+        # Create DRM preview
+        preview = DrmPreview(self._picam2)
+        
+        self._preview_active = True
+        self._preview_type = "drm"
+        
+        return True
     
+    @_guard("Error stopping preview")
     def stop(self) -> bool:
         """
         Stop active preview
@@ -188,19 +204,15 @@ class PreviewAPI:
         if not self._preview_active:
             return True
         
-        try:
-            logger.info("Stopping preview")
-            
-            self._picam2.stop_preview()
-            self._preview_active = False
-            self._preview_type = None
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error stopping preview: {e}")
-            return False
+        logger.info("Stopping preview")
+        
+        self._picam2.stop_preview()
+        self._preview_active = False
+        self._preview_type = None
+        
+        return True
     
+    @_guard("Error configuring preview")
     def configure(self, width: int = None, height: int = None, **kwargs) -> bool:
         """
         Configure preview settings
@@ -217,31 +229,26 @@ class PreviewAPI:
             logger.warning("Cannot configure inactive preview")
             return False
         
-        try:
-            logger.info("Configuring preview")
-            
-            # Update configuration
-            config = self._preview_config.copy()
-            
-            if width is not None:
-                config['width'] = width
-            
-            if height is not None:
-                config['height'] = height
-            
-            # Add any additional parameters
-            config.update(kwargs)
-            
-            # Restart preview with new configuration
-            preview_type = self._preview_type
-            self.stop()
-            result = self.start(preview_type=preview_type, **config)
-            
-            return result
-            
-        except Exception as e:
-            logger.error(f"Error configuring preview: {e}")
-            return False
+        logger.info("Configuring preview")
+        
+        # Update configuration
+        config = self._preview_config.copy()
+        
+        if width is not None:
+            config['width'] = width
+        
+        if height is not None:
+            config['height'] = height
+        
+        # Add any additional parameters
+        config.update(kwargs)
+        
+        # Restart preview with new configuration
+        preview_type = self._preview_type
+        self.stop()
+        result = self.start(preview_type=preview_type, **config)
+        
+        return result
     
     @property
     def is_active(self) -> bool:
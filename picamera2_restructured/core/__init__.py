@@ -25,13 +25,27 @@ register_module('config_manager', 'picamera2_restructured.core.configuration_man
 _camera_core = lazy_import('.camera_core', __package__)
 _config_manager = lazy_import('.configuration_manager', __package__)
 
-# Create lazy objects for commonly used classes
-CameraCore = LazyObject(lambda: _camera_core.CameraCore)
-ConfigurationManager = LazyObject(lambda: _config_manager.ConfigurationManager)
+# Classes resolved on first attribute access (PEP 562), so importing this
+# package does not pull in Picamera2 until a core class is actually used
+_LAZY_CLASSES = {
+    'CameraCore': _camera_core,
+    'ConfigurationManager': _config_manager,
+}
+
+
+def __getattr__(name):
+    loader = _LAZY_CLASSES.get(name)
+    if loader is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(loader, name)
+    # Cache the real class so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_CLASSES))
 
-# For backward compatibility, ensure direct imports still work
-from .camera_core import CameraCore
-from .configuration_manager import ConfigurationManager
 
 __all__ = [
     # Core classes
@@ -11,14 +11,35 @@ to be used directly by most users.
 
 import logging
 import threading
+import weakref
 from typing import Dict, Any, Optional, List, Tuple
 
 # Import original PiCamera2 functionality
 from picamera2.picamera2 import Picamera2
 
+from .guard import _guard
+
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Frame buffers queued per stream. Two keeps one frame in flight while the
+# next is filled; four gives the encoder headroom for high-quality recording
+# at the cost of latency and one extra frame of memory per buffer.
+REALTIME_BUFFER_COUNT = 2
+RECORDING_BUFFER_COUNT = 4
+
+
+def _safe_close(picam2) -> None:
+    """Release a Picamera2 instance whose CameraCore was never closed"""
+    try:
+        if picam2.started:
+            picam2.stop()
+        picam2.close()
+    except Exception:
+        # Runs from the garbage collector or at interpreter exit; there is
+        # nobody left to report to
+        pass
+
 
 class CameraCore:
     """
@@ -28,19 +49,33 @@ class CameraCore:
     common functionality for the higher-level API interfaces.
     """
     
-    def __init__(self, camera_num: int = 0):
+    __slots__ = ('_camera_num', '_buffer_count', '_picam2', '_initialized', '_lock',
+                 '_init_event', '_init_thread', '_finalizer', '__weakref__')
+    
+    def __init__(self, camera_num: int = 0, buffer_count: int = REALTIME_BUFFER_COUNT):
         """
         Initialize camera core
         
         Args:
             camera_num: Camera number to use (default: 0 for main camera)
+            buffer_count: Frame buffers per stream. The default of 2 keeps
+                preview and streaming latency low; use RECORDING_BUFFER_COUNT
+                (4) for high-quality recording where dropped frames matter
+                more than latency. Values below 2 stall capture while a
+                frame is being read.
         """
         self._camera_num = camera_num
+        self._buffer_count = buffer_count
         self._picam2: Optional[Picamera2] = None
         self._initialized = False
-        self._lock = threading.RLock()
+        self._lock = threading.Lock()
+        # Set once a background initialization attempt has finished
+        self._init_event = threading.Event()
+        self._init_thread: Optional[threading.Thread] = None
+        # Closes the camera if this object is dropped without close()
+        self._finalizer: Optional[weakref.finalize] = None
         
-        logger.debug(f"CameraCore initialized for camera {camera_num}")
+        logger.debug("CameraCore initialized for camera %s", camera_num)
     
     def initialize(self) -> bool:
         """
@@ -53,16 +88,55 @@ class CameraCore:
             logger.debug("Camera already initialized")
             return True
         
+        self.initialize_async()
+        self._init_event.wait()
+        return self._initialized
+    
+    def initialize_async(self) -> None:
+        """
+        Start initializing the camera hardware in a background thread
+        
+        Constructing Picamera2 enumerates sensors and allocates buffers, so
+        callers can overlap it with their own setup. Methods that need the
+        camera wait for the initialization to finish.
+        """
+        with self._lock:
+            if self._initialized or (self._init_thread and self._init_thread.is_alive()):
+                return
+            
+            self._init_event.clear()
+            self._init_thread = threading.Thread(
+                target=self._initialize_worker,
+                name=f"CameraCoreInit-{self._camera_num}",
+                daemon=True
+            )
+            self._init_thread.start()
+    
+    def _initialize_worker(self) -> None:
+        """Construct the Picamera2 instance and signal completion"""
         try:
+            logger.debug("Initializing camera %s", self._camera_num)
+            picam2 = Picamera2(camera_num=self._camera_num)
+            try:
+                picam2.configure(picam2.create_video_configuration(buffer_count=self._buffer_count))
+            except Exception:
+                # Release the camera so a later initialize() can acquire it
+                _safe_close(picam2)
+                raise
             with self._lock:
-                logger.debug(f"Initializing camera {self._camera_num}")
-                self._picam2 = Picamera2(camera_num=self._camera_num)
+                self._picam2 = picam2
+                self._finalizer = weakref.finalize(self, _safe_close, picam2)
                 self._initialized = True
-                return True
         except Exception as e:
-            logger.error(f"Failed to initialize camera: {e}")
+            logger.error("Failed to initialize camera: %s", e)
             self._initialized = False
-            return False
+        finally:
+            self._init_event.set()
+    
+    def _wait_for_init(self) -> None:
+        """Block until a pending background initialization has finished"""
+        if self._init_thread is not None:
+            self._init_event.wait()
     
     @property
     def picam2(self) -> Optional[Picamera2]:
@@ -79,11 +153,17 @@ class CameraCore:
         """Get the camera number"""
         return self._camera_num
     
+    @property
+    def buffer_count(self) -> int:
+        """Get the number of frame buffers per stream"""
+        return self._buffer_count
+    
     @property
     def is_initialized(self) -> bool:
         """Check if camera is initialized"""
         return self._initialized
     
+    @_guard("Failed to start camera")
     def start(self) -> bool:
         """
         Start the camera
@@ -91,18 +171,15 @@ class CameraCore:
         Returns:
             bool: True if started successfully
         """
-        if not self._initialized:
-            if not self.initialize():
-                return False
-        
-        try:
-            with self._lock:
-                self._picam2.start()
-                return True
-        except Exception as e:
-            logger.error(f"Failed to start camera: {e}")
+        if not self.initialize():
             return False
+        
+        picam2 = self._picam2
+        with self._lock:
+            picam2.start()
+            return True
     
+    @_guard("Failed to stop camera")
     def stop(self) -> bool:
         """
         Stop the camera
@@ -110,18 +187,16 @@ class CameraCore:
         Returns:
             bool: True if stopped successfully
         """
-        if not self._initialized or not self._picam2:
+        picam2 = self._picam2
+        if not self._initialized or not picam2:
             return True
         
-        try:
-            with self._lock:
-                if self._picam2.started:
-                    self._picam2.stop()
-                return True
-        except Exception as e:
-            logger.error(f"Failed to stop camera: {e}")
-            return False
+        with self._lock:
+            if picam2.started:
+                picam2.stop()
+            return True
     
+    @_guard("Failed to close camera")
     def close(self) -> bool:
         """
         Close the camera and release resources
@@ -129,20 +204,22 @@ class CameraCore:
         Returns:
             bool: True if closed successfully
         """
-        if not self._initialized or not self._picam2:
+        self._wait_for_init()
+        picam2 = self._picam2
+        if not self._initialized or not picam2:
             return True
         
-        try:
-            with self._lock:
-                if self._picam2.started:
-                    self._picam2.stop()
-                self._picam2.close()
-                self._initialized = False
-                self._picam2 = None
-                return True
-        except Exception as e:
-            logger.error(f"Failed to close camera: {e}")
-            return False
+        with self._lock:
+            finalizer = self._finalizer
+            if finalizer is not None:
+                finalizer.detach()
+                self._finalizer = None
+            if picam2.started:
+                picam2.stop()
+            picam2.close()
+            self._initialized = False
+            self._picam2 = None
+            return True
     
     def get_camera_info(self) -> Dict[str, Any]:
         """
@@ -151,6 +228,7 @@ class CameraCore:
         Returns:
             Dict with camera information
         """
+        self._wait_for_init()
         if not self._initialized or not self._picam2:
             return {}
         
@@ -167,7 +245,7 @@ class CameraCore:
             
             return info
         except Exception as e:
-            logger.error(f"Failed to get camera info: {e}")
+            logger.error("Failed to get camera info: %s", e)
             return {'error': str(e)}
     
     def get_camera_modes(self) -> List[Dict[str, Any]]:
@@ -177,15 +255,12 @@ class CameraCore:
         Returns:
             List of camera modes
         """
+        self._wait_for_init()
         if not self._initialized or not self._picam2:
             return []
         
         try:
             return self._picam2.sensor_modes
         except Exception as e:
-            logger.error(f"Failed to get camera modes: {e}")
+            logger.error("Failed to get camera modes: %s", e)
             return []
-    
-    def __del__(self):
-        """Destructor to ensure resources are released"""
-        self.close()
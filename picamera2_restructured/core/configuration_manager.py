@@ -8,12 +8,45 @@ It abstracts the complexity of the Picamera2 configuration system and provides
 simple, pre-defined configurations for common use cases.
 """
 
+import hashlib
+import json
 import logging
 from typing import Dict, Any, List, Optional, Tuple
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Smallest lores stream created alongside a main stream
+LORES_MIN_SIZE = (320, 240)
+
+# Controls applied on top of a still configuration for low light
+LOW_LIGHT_CONTROLS = {
+    'AnalogueGain': 8.0,           # Increase gain
+    'ExposureTime': 66666,         # Longer exposure (1/15s)
+    'AwbEnable': 1,                # Enable auto white balance
+    'NoiseReductionMode': 'HighQuality',  # High quality noise reduction
+}
+
+
+def _lores_size(width: int, height: int,
+                min_width: int = LORES_MIN_SIZE[0],
+                min_height: int = LORES_MIN_SIZE[1]) -> Tuple[int, int]:
+    """Get the lores stream size for a main stream (a quarter of it, at least LORES_MIN_SIZE)"""
+    width >>= 2
+    height >>= 2
+    return (width if width > min_width else min_width,
+            height if height > min_height else min_height)
+
+
+def _config_digest(config: Dict[str, Any]) -> Any:
+    """Get a compact canonical digest for telling whether two configurations are the same"""
+    try:
+        canonical = json.dumps(config, sort_keys=True, default=str)
+        return hashlib.blake2b(canonical.encode(), digest_size=16).digest()
+    except (TypeError, ValueError):
+        # Not serializable; only the very same object counts as unchanged
+        return id(config)
+
 
 class ConfigurationManager:
     """
@@ -23,6 +56,9 @@ class ConfigurationManager:
     including predefined configurations for common use cases.
     """
     
+    __slots__ = ('_picam2', '_current_config', '_current_config_digest',
+                 '_applied_camera_config', '_max_mode_size', '_config_templates', '__weakref__')
+    
     def __init__(self, picam2):
         """
         Initialize configuration manager
@@ -32,6 +68,9 @@ class ConfigurationManager:
         """
         self._picam2 = picam2
         self._current_config = None
+        self._current_config_digest = None
+        self._applied_camera_config = None
+        self._max_mode_size: Optional[Tuple[int, int]] = None
         
         # Predefined configuration templates
         self._config_templates = {
@@ -53,25 +92,28 @@ class ConfigurationManager:
         Returns:
             Dict containing camera configuration
         """
-        try:
-            # Use predefined template if available
-            if config_type in self._config_templates:
-                return self._config_templates[config_type](**kwargs)
-            else:
-                # Create default configuration
-                logger.warning(f"Unknown config type '{config_type}', using default")
-                return self._create_default_config(**kwargs)
-        except Exception as e:
-            logger.error(f"Failed to create configuration: {e}")
-            return self._create_default_config()
+        if config_type not in self._config_templates:
+            # Create default configuration
+            logger.warning("Unknown config type '%s', using default", config_type)
+            return self._create_default_config(**kwargs)
+        
+        # Use predefined template
+        return self._config_templates[config_type](**kwargs)
     
-    def apply_configuration(self, config: Dict[str, Any] = None, config_type: str = None, **kwargs) -> bool:
+    def apply_configuration(self, config: Dict[str, Any] = None, config_type: str = None,
+                            force: bool = False, **kwargs) -> bool:
         """
         Apply configuration to camera
         
+        Reapplying the configuration that is already active is skipped, since
+        every configure() reallocates the camera buffers. The skip only applies
+        while Picamera2 still holds the configuration applied here; any other
+        configure() call on the camera replaces it.
+        
         Args:
             config: Configuration dict to apply
             config_type: Type of configuration to create and apply
+            force: Reconfigure even if the configuration is unchanged
             **kwargs: Additional configuration parameters
             
         Returns:
@@ -83,16 +125,26 @@ class ConfigurationManager:
                 config = self.create_configuration(config_type, **kwargs)
             
             if config is None:
-                # Use default configuration
+                # Use default configuration, reading back what was applied once
                 self._picam2.configure()
+                config = self._picam2.camera_config
+                digest = None
             else:
+                digest = _config_digest(config)
+                if (not force and digest == self._current_config_digest
+                        and self._picam2.camera_config is self._applied_camera_config):
+                    logger.debug("Configuration unchanged, not reconfiguring")
+                    return True
+                
                 # Apply provided configuration
                 self._picam2.configure(config)
             
             self._current_config = config
+            self._current_config_digest = digest
+            self._applied_camera_config = self._picam2.camera_config
             return True
         except Exception as e:
-            logger.error(f"Failed to apply configuration: {e}")
+            logger.error("Failed to apply configuration: %s", e)
             return False
     
     def _create_default_config(self, **kwargs) -> Dict[str, Any]:
@@ -101,124 +153,98 @@ class ConfigurationManager:
             config = self._picam2.create_still_configuration(**kwargs)
             return config
         except Exception as e:
-            logger.error(f"Failed to create default config: {e}")
+            logger.error("Failed to create default config: %s", e)
             return {}
     
     def _create_still_config(self, width: int = None, height: int = None, **kwargs) -> Dict[str, Any]:
         """Create configuration optimized for still image capture"""
-        try:
-            config_args = kwargs.copy()
+        # kwargs is already a fresh dict, so it is extended in place
+        config_args = kwargs
+        
+        # Add resolution if provided
+        if width is not None and height is not None:
+            config_args['main'] = {"size": (width, height)}
             
-            # Add resolution if provided
-            if width is not None and height is not None:
-                config_args['main'] = {"size": (width, height)}
+            # Set lores stream for preview if not specified
+            if "lores" not in config_args:
+                config_args["lores"] = {"size": _lores_size(width, height)}
                 
-                # Set lores stream for preview if not specified
-                if "lores" not in config_args:
-                    # Calculate lores resolution (1/4 of main)
-                    lores_width = max(width // 4, 320)
-                    lores_height = max(height // 4, 240)
-                    config_args["lores"] = {"size": (lores_width, lores_height)}
-                    
-            # Create configuration
-            config = self._picam2.create_still_configuration(**config_args)
-            return config
+        # Create configuration
+        try:
+            return self._picam2.create_still_configuration(**config_args)
         except Exception as e:
-            logger.error(f"Failed to create still config: {e}")
+            logger.error("Failed to create still config: %s", e)
             return self._create_default_config()
     
     def _create_video_config(self, width: int = 1920, height: int = 1080, fps: int = 30, **kwargs) -> Dict[str, Any]:
         """Create configuration optimized for video recording"""
+        # kwargs is already a fresh dict, so it is extended in place
+        config_args = kwargs
+        
+        # Set video resolution
+        config_args['main'] = {"size": (width, height)}
+        
+        # Set lores stream for preview if not specified
+        if "lores" not in config_args:
+            config_args["lores"] = {"size": _lores_size(width, height)}
+        
+        # Set framerate without modifying the caller's controls
+        if fps > 0:
+            config_args["controls"] = {**config_args.get("controls", {}), "FrameRate": fps}
+        
+        # Create configuration
         try:
-            config_args = kwargs.copy()
-            
-            # Set video resolution
-            config_args['main'] = {"size": (width, height)}
-            
-            # Set lores stream for preview if not specified
-            if "lores" not in config_args:
-                # Calculate lores resolution (1/4 of main)
-                lores_width = max(width // 4, 320)
-                lores_height = max(height // 4, 240)
-                config_args["lores"] = {"size": (lores_width, lores_height)}
-            
-            # Set framerate
-            if fps > 0:
-                if "controls" not in config_args:
-                    config_args["controls"] = {}
-                
-                config_args["controls"]["FrameRate"] = fps
-            
-            # Create configuration
-            config = self._picam2.create_video_configuration(**config_args)
-            return config
+            return self._picam2.create_video_configuration(**config_args)
         except Exception as e:
-            logger.error(f"Failed to create video config: {e}")
+            logger.error("Failed to create video config: %s", e)
             return self._create_default_config()
     
     def _create_preview_config(self, width: int = 640, height: int = 480, **kwargs) -> Dict[str, Any]:
         """Create configuration optimized for preview"""
+        # kwargs is already a fresh dict, so it is extended in place
+        config_args = kwargs
+        
+        # Set preview resolution
+        config_args['main'] = {"size": (width, height)}
+        
+        # Create configuration
         try:
-            config_args = kwargs.copy()
-            
-            # Set preview resolution
-            config_args['main'] = {"size": (width, height)}
-            
-            # Create configuration
-            config = self._picam2.create_preview_configuration(**config_args)
-            return config
+            return self._picam2.create_preview_configuration(**config_args)
         except Exception as e:
-            logger.error(f"Failed to create preview config: {e}")
+            logger.error("Failed to create preview config: %s", e)
             return self._create_default_config()
     
     def _create_high_res_config(self, **kwargs) -> Dict[str, Any]:
         """Create configuration for highest resolution still capture"""
-        try:
-            # Get maximum sensor resolution
-            sensor_modes = self._picam2.sensor_modes
-            if sensor_modes:
-                max_width = 0
-                max_height = 0
-                max_mode = None
-                
-                # Find mode with highest resolution
-                for mode in sensor_modes:
-                    width = mode.get('size', (0, 0))[0]
-                    height = mode.get('size', (0, 0))[1]
-                    
-                    if width * height > max_width * max_height:
-                        max_width = width
-                        max_height = height
-                        max_mode = mode
-                
-                if max_mode:
-                    return self._create_still_config(width=max_width, height=max_height, **kwargs)
-            
+        # Sensor modes are fixed per camera and expensive to query, so the
+        # largest one is looked up once
+        if self._max_mode_size is None:
+            try:
+                self._max_mode_size = self._find_max_mode_size()
+            except Exception as e:
+                logger.error("Failed to create high-res config: %s", e)
+                return self._create_default_config()
+        
+        width, height = self._max_mode_size
+        return self._create_still_config(width=width, height=height, **kwargs)
+    
+    def _find_max_mode_size(self) -> Tuple[int, int]:
+        """Find the size of the highest resolution sensor mode"""
+        sizes = [mode.get('size', (0, 0)) for mode in self._picam2.sensor_modes or ()]
+        width, height = max(sizes, key=lambda size: size[0] * size[1], default=(0, 0))
+        
+        if width * height == 0:
             # Fallback to default high resolution
-            return self._create_still_config(width=4056, height=3040, **kwargs)
-        except Exception as e:
-            logger.error(f"Failed to create high-res config: {e}")
-            return self._create_default_config()
+            return (4056, 3040)
+        return (width, height)
     
     def _create_low_light_config(self, **kwargs) -> Dict[str, Any]:
         """Create configuration optimized for low light conditions"""
-        try:
-            config = self._create_still_config(**kwargs)
-            
-            # Add low-light specific controls
-            controls = config.get('controls', {})
-            controls.update({
-                'AnalogueGain': 8.0,           # Increase gain
-                'ExposureTime': 66666,         # Longer exposure (1/15s)
-                'AwbEnable': 1,                # Enable auto white balance
-                'NoiseReductionMode': 'HighQuality',  # High quality noise reduction
-            })
-            
-            config['controls'] = controls
-            return config
-        except Exception as e:
-            logger.error(f"Failed to create low-light config: {e}")
-            return self._create_default_config()
+        config = self._create_still_config(**kwargs)
+        
+        # Add low-light specific controls
+        config.setdefault('controls', {}).update(LOW_LIGHT_CONTROLS)
+        return config
     
     def get_current_config(self) -> Dict[str, Any]:
         """
@@ -227,13 +253,16 @@ class ConfigurationManager:
         Returns:
             Dict containing current configuration
         """
-        if self._current_config:
+        # The cached configuration is authoritative; camera_config is only
+        # read when nothing has been applied through this manager yet
+        if self._current_config is not None:
             return self._current_config
         
         try:
-            return self._picam2.camera_config
+            self._current_config = self._picam2.camera_config
+            return self._current_config
         except Exception as e:
-            logger.error(f"Failed to get current config: {e}")
+            logger.error("Failed to get current config: %s", e)
             return {}
     
     def get_available_configs(self) -> List[str]:
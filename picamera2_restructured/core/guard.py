@@ -0,0 +1,37 @@
+"""
+Shared error handling for the camera API methods.
+
+Public camera methods report failure by logging the exception and returning
+False rather than raising. This module provides that handling once, as a
+decorator, instead of repeating a try/except block in every method.
+"""
+
+import functools
+import logging
+from typing import Any, Callable
+
+
+def _guard(op_name: str, default: Any = False) -> Callable:
+    """
+    Log and swallow exceptions raised by the decorated method
+
+    Args:
+        op_name: Message logged in front of the exception text
+        default: Value returned when the method raises
+
+    Returns:
+        Decorator for the method
+    """
+    def deco(fn):
+        # Log through the decorated function's module logger
+        logger = logging.getLogger(fn.__module__)
+
+        @functools.wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return fn(self, *args, **kwargs)
+            except Exception as e:
+                logger.error("%s: %s", op_name, e)
+                return default
+        return wrapper
+    return deco
@@ -42,6 +42,11 @@ class LazyLoader:
         """
         if self._module is None:
             self._module = importlib.import_module(self._name, self._package)
+            
+            # Copy the module namespace onto the loader so later lookups are
+            # plain instance-dict hits and never reach __getattr__ again
+            own = self.__dict__
+            own.update({k: v for k, v in vars(self._module).items() if k not in own})
         return getattr(self._module, attr)
 
 class LazyImporter:
@@ -52,6 +57,8 @@ class LazyImporter:
     and memory usage.
     """
     
+    __slots__ = ('_modules',)
+    
     def __init__(self):
         """Initialize the lazy importer."""
         self._modules = {}
@@ -67,10 +74,12 @@ class LazyImporter:
         Returns:
             Lazy loader for the module
         """
-        key = (name, package)
-        if key not in self._modules:
-            self._modules[key] = LazyLoader(name, package)
-        return self._modules[key]
+        # Interned "package\0name" keys compare by identity in the dict lookup
+        key = sys.intern(name if package is None else package + "\x00" + name)
+        loader = self._modules.get(key)
+        if loader is None:
+            loader = self._modules[key] = LazyLoader(name, package)
+        return loader
 
 # Global lazy importer instance
 lazy_importer = LazyImporter()
@@ -142,7 +151,7 @@ class LazyModule(types.ModuleType):
         # Check if it's a lazy submodule
         if name in self._lazy_submodules:
             module = importlib.import_module(self._lazy_submodules[name])
-            setattr(self, name, module)
+            self.__dict__[name] = module
             return module
         
         # Check if it's a lazy attribute
@@ -150,7 +159,7 @@ class LazyModule(types.ModuleType):
             module_path, attribute = self._lazy_attributes[name]
             module = importlib.import_module(module_path)
             value = getattr(module, attribute)
-            setattr(self, name, value)
+            self.__dict__[name] = value
             return value
         
         # Not found
@@ -179,6 +188,8 @@ class LazyObject:
     which can significantly reduce startup time and memory usage.
     """
     
+    __slots__ = ('_factory', '_object')
+    
     def __init__(self, factory):
         """
         Initialize the lazy object.
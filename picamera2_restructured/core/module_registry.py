@@ -8,6 +8,7 @@ which can be used to optimize module loading and initialization.
 import importlib
 import sys
 import threading
+from collections import deque
 from typing import Dict, Any, List, Set, Optional, Callable
 
 class ModuleRegistry:
@@ -23,6 +24,8 @@ class ModuleRegistry:
         self._modules = {}
         self._dependencies = {}
         self._initialized = set()
+        # Reentrant: imports and module initialize() calls run under the
+        # lock and may register or look up other modules
         self._lock = threading.RLock()
     
     def register(self, name, module_path, dependencies=None):
@@ -69,65 +72,151 @@ class ModuleRegistry:
             if name in self._initialized:
                 return
             
-            # Check if the module is registered
-            if name not in self._modules:
-                raise ValueError(f"Module {name} is not registered")
+            # Initialize dependencies first, then the module itself
+            self._initialize_in_order(self._dependency_order([name]))
+    
+    def get_modules(self, names):
+        """
+        Get several modules by name under a single lock acquisition.
+        
+        Args:
+            names: Names of the modules
             
-            # Initialize dependencies first
-            for dependency in self._dependencies[name]:
-                self.initialize(dependency)
+        Returns:
+            Dictionary mapping module names to loaded modules
+        """
+        with self._lock:
+            return self._import_modules(names)
+    
+    def initialize_and_get_modules(self, names):
+        """
+        Initialize several modules and their dependencies, then return them.
+        
+        Args:
+            names: Names of the modules
             
-            # Load and initialize the module
-            module = self.get_module(name)
-            if hasattr(module, 'initialize'):
-                module.initialize()
+        Returns:
+            Dictionary mapping module names to loaded and initialized modules
+        """
+        with self._lock:
+            self._initialize_in_order(self._dependency_order(names))
+            return self._import_modules(names)
+    
+    def _import_modules(self, names):
+        """
+        Import registered modules by name (lock must be held).
+        
+        Args:
+            names: Names of the modules
             
-            # Mark as initialized
-            self._initialized.add(name)
+        Returns:
+            Dictionary mapping module names to loaded modules
+        """
+        for name in names:
+            if name not in self._modules:
+                raise ValueError(f"Module {name} is not registered")
+        return {name: importlib.import_module(self._modules[name]) for name in names}
     
     def initialize_all(self):
         """Initialize all registered modules."""
         with self._lock:
-            # Sort modules by dependencies
-            modules = self._sort_by_dependencies()
+            self._initialize_in_order(self._sort_by_dependencies())
+    
+    def _initialize_in_order(self, names):
+        """
+        Initialize modules given in dependency order (lock must be held).
+        
+        Dependencies come first in the order, so each module is initialized
+        directly without going through initialize().
+        
+        Args:
+            names: Module names sorted by dependencies
+        """
+        for name in names:
+            if name in self._initialized:
+                continue
             
-            # Initialize modules in order
-            for name in modules:
-                self.initialize(name)
+            module = importlib.import_module(self._modules[name])
+            if hasattr(module, 'initialize'):
+                module.initialize()
+            self._initialized.add(name)
     
-    def _sort_by_dependencies(self):
+    def _dependency_order(self, names):
         """
-        Sort modules by dependencies.
+        Order modules and everything they depend on, dependencies first.
         
+        Iterative depth-first search with an explicit stack, so deep
+        dependency chains do not cost a Python frame per module.
+        
+        Args:
+            names: Names of the modules
+            
         Returns:
             List of module names sorted by dependencies
         """
-        # Build dependency graph
-        graph = {name: list(deps) for name, deps in self._dependencies.items()}
-        
-        # Topological sort
         result = []
         visited = set()
         temp = set()
         
-        def visit(node):
-            if node in temp:
-                raise ValueError(f"Circular dependency detected involving {node}")
-            if node in visited:
-                return
+        for root in names:
+            if root in visited:
+                continue
+            if root not in self._modules:
+                raise ValueError(f"Module {root} is not registered")
             
-            temp.add(node)
-            for neighbor in graph.get(node, []):
-                visit(neighbor)
-            
-            temp.remove(node)
-            visited.add(node)
+            temp.add(root)
+            stack = [(root, iter(self._dependencies[root]))]
+            while stack:
+                node, dependencies = stack[-1]
+                for dependency in dependencies:
+                    if dependency in visited:
+                        continue
+                    if dependency in temp:
+                        raise ValueError(f"Circular dependency detected involving {dependency}")
+                    if dependency not in self._modules:
+                        raise ValueError(f"Module {dependency} is not registered")
+                    temp.add(dependency)
+                    stack.append((dependency, iter(self._dependencies[dependency])))
+                    break
+                else:
+                    # All dependencies placed; the module can follow them
+                    stack.pop()
+                    temp.discard(node)
+                    visited.add(node)
+                    result.append(node)
+        
+        return result
+    
+    def _sort_by_dependencies(self):
+        """
+        Sort modules by dependencies (Kahn's algorithm).
+        
+        Returns:
+            List of module names sorted by dependencies
+        """
+        # Count unmet dependencies and record the reverse edges
+        in_degree = {name: len(deps) for name, deps in self._dependencies.items()}
+        dependents = {name: [] for name in self._modules}
+        for name, deps in self._dependencies.items():
+            for dependency in deps:
+                if dependency not in self._modules:
+                    raise ValueError(f"Module {dependency} is not registered")
+                dependents[dependency].append(name)
+        
+        # Repeatedly take modules whose dependencies are all placed
+        ready = deque(name for name, degree in in_degree.items() if degree == 0)
+        result = []
+        while ready:
+            node = ready.popleft()
             result.append(node)
+            for dependent in dependents[node]:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    ready.append(dependent)
         
-        # Visit all nodes
-        for name in self._modules:
-            if name not in visited:
-                visit(name)
+        if len(result) != len(in_degree):
+            remaining = sorted(name for name, degree in in_degree.items() if degree)
+            raise ValueError(f"Circular dependency detected involving {', '.join(remaining)}")
         
         return result
     
@@ -239,7 +328,7 @@ class ModuleLoader:
         Returns:
             Dictionary mapping module names to loaded modules
         """
-        return {name: self.load(name) for name in names}
+        return self.registry.get_modules(names)
     
     def load_and_initialize_multiple(self, names):
         """
@@ -251,7 +340,7 @@ class ModuleLoader:
         Returns:
             Dictionary mapping module names to loaded and initialized modules
         """
-        return {name: self.load_and_initialize(name) for name in names}
+        return self.registry.initialize_and_get_modules(names)
 
 # Global module loader instance
 module_loader = ModuleLoader()
@@ -5,10 +5,12 @@ This module contains device-specific implementations for different camera module
 and AI acceleration hardware supported by PiCamera2.
 """
 
-from .device_manager import DeviceManager
-from .base_device import BaseDevice
+from .device_manager import DeviceManager, warm_imports
+from .base_device import BaseDevice, ModelInfo
 
 __all__ = [
     'DeviceManager',
     'BaseDevice',
+    'ModelInfo',
+    'warm_imports',
 ]
@@ -6,12 +6,32 @@ can be extended for different camera models and AI acceleration hardware.
 """
 
 import logging
-from typing import Dict, Any, Optional, List, Tuple
+import types
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AbstractSet, Dict, Any, Mapping, Optional, Tuple
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class ModelInfo:
+    """
+    AI model loaded into a device
+    """
+    name: str
+    type: str = ''
+    path: Optional[Path] = None
+    config: Optional[Path] = None
+    loaded_at: float = 0.0
+    instance: Any = None
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dictionary-style field access, e.g. model.get('name')"""
+        return getattr(self, key, default)
+
+
 class BaseDevice:
     """
     Base class for device-specific implementations
@@ -20,6 +40,12 @@ class BaseDevice:
     and should be extended for each supported device.
     """
     
+    __slots__ = ('_name', '_camera_properties', '_camera_properties_view', '_capabilities',
+                 '_capabilities_tuple', '_initialized', '__weakref__')
+    
+    # Capabilities of the device type; subclasses override this
+    _CAPABILITIES: AbstractSet[str] = frozenset()
+    
     def __init__(self, name: str, camera_properties: Dict[str, Any] = None):
         """
         Initialize base device
@@ -30,7 +56,10 @@ class BaseDevice:
         """
         self._name = name
         self._camera_properties = camera_properties or {}
-        self._capabilities = set()
+        # Read-only view handed out instead of copying the properties
+        self._camera_properties_view = types.MappingProxyType(self._camera_properties)
+        self._capabilities = self._CAPABILITIES
+        self._capabilities_tuple = None
         self._initialized = False
         
         logger.debug(f"Base device '{name}' initialized")
@@ -41,14 +70,17 @@ class BaseDevice:
         return self._name
     
     @property
-    def camera_properties(self) -> Dict[str, Any]:
-        """Get camera properties"""
-        return self._camera_properties.copy()
+    def camera_properties(self) -> Mapping[str, Any]:
+        """Get camera properties (read-only view)"""
+        return self._camera_properties_view
     
     @property
-    def capabilities(self) -> List[str]:
-        """Get device capabilities"""
-        return list(self._capabilities)
+    def capabilities(self) -> Tuple[str, ...]:
+        """Get device capabilities, sorted (built once the device is initialized)"""
+        capabilities = self._capabilities_tuple
+        if capabilities is None:
+            capabilities = tuple(sorted(self._capabilities))
+        return capabilities
     
     def has_capability(self, capability: str) -> bool:
         """
@@ -69,6 +101,10 @@ class BaseDevice:
         Returns:
             bool: True if device initialized successfully
         """
+        # Subclasses fill in their capabilities before this point; freezing
+        # them lets other threads read them without a lock
+        self._capabilities = frozenset(self._capabilities)
+        self._capabilities_tuple = tuple(sorted(self._capabilities))
         self._initialized = True
         return True
     
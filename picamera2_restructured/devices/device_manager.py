@@ -3,18 +3,82 @@ DeviceManager - Management of camera devices and hardware accelerators
 
 This module provides functionality to detect, initialize, and manage
 different camera devices and hardware accelerators.
+
+Picamera2 and the device classes are imported on first use. Multi-process
+pipelines (e.g. preview, recorder and AI consumer) should call warm_imports()
+once in the parent before starting workers with the 'fork' start method, so
+the children inherit the loaded modules instead of each importing them from
+the SD card.
 """
 
+import functools
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, List, Union
 import os
 import importlib
+import re
+import sys
+import time
+import types
 
 from .base_device import BaseDevice
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Seconds a detect_devices() result is reused before libcamera is queried again
+DETECT_TTL = 5.0
+
+# Upper bound on threads used to release devices concurrently
+RELEASE_WORKERS = 8
+
+# Module and class implementing each builtin device type, imported on first use
+_DEVICE_CLASSES = {
+    'imx708': ('.imx708.imx708_device', 'IMX708Device'),
+    'imx500': ('.imx500.imx500_device', 'IMX500Device'),
+    'hailo': ('.hailo.hailo_device', 'HailoDevice'),
+}
+
+# Sensor names recognised in a camera's model string; the match is the device type
+_MODEL_RE = re.compile(r'(imx708|imx500|imx477|imx296)')
+
+
+@functools.lru_cache(maxsize=None)
+def _load_picamera2():
+    """Import the original Picamera2 class once, on first use"""
+    from picamera2.picamera2 import Picamera2
+    return Picamera2
+
+
+def warm_imports() -> bool:
+    """
+    Import Picamera2 and the device classes ahead of time
+    
+    Returns:
+        bool: True if Picamera2 could be imported
+    """
+    try:
+        _load_picamera2()
+    except ImportError as e:
+        logger.warning(f"Could not import Picamera2: {e}")
+        return False
+    
+    for module_name, cls_name in _DEVICE_CLASSES.values():
+        _load_device_cls(module_name, cls_name)
+    return True
+
+
+@functools.lru_cache(maxsize=None)
+def _load_device_cls(module_name: str, cls_name: str) -> type:
+    """Import a device class once, on first use"""
+    return getattr(importlib.import_module(module_name, __package__), cls_name)
+
+
+def _create_device(module_name: str, cls_name: str, device_name: str) -> BaseDevice:
+    """Create a device from its lazily imported class"""
+    return _load_device_cls(module_name, cls_name)(device_name)
+
 
 class DeviceManager:
     """
@@ -24,17 +88,29 @@ class DeviceManager:
     different camera devices and hardware accelerators.
     """
     
-    def __init__(self):
-        """Initialize device manager"""
+    # Release devices concurrently in release_all_devices(); set to False if
+    # teardown must happen one device at a time
+    parallel_release = True
+    
+    def __init__(self, detect_ttl: float = DETECT_TTL):
+        """
+        Initialize device manager
+        
+        Args:
+            detect_ttl: Seconds to reuse a device detection result
+        """
         self._devices = {}
+        # Type each initialized device was created as
+        self._device_type_of = {}
         self._detected_devices = {}
+        self._detect_cache_ts = 0.0
+        self._detect_ttl = detect_ttl
         
         # Register builtin device types
-        self._device_types = {
-            'imx708': self._create_imx708,
-            'imx500': self._create_imx500,
-            'hailo': self._create_hailo,
-        }
+        self._device_types = types.MappingProxyType({
+            device_type: functools.partial(_create_device, module_name, cls_name)
+            for device_type, (module_name, cls_name) in _DEVICE_CLASSES.items()
+        })
         
         logger.debug("DeviceManager initialized")
     
@@ -42,14 +118,21 @@ class DeviceManager:
         """
         Detect available camera devices
         
+        The result is reused for a few seconds so that listing devices and
+        then initializing one does not enumerate the cameras twice.
+        
         Returns:
             Dict mapping device names to device types
         """
+        if (self._detected_devices and
+                time.monotonic() - self._detect_cache_ts < self._detect_ttl):
+            return self._detected_devices
+        
         detected = {}
         
         try:
-            # Import original Picamera2 for detection
-            from picamera2.picamera2 import Picamera2
+            # Original Picamera2 is used for detection
+            Picamera2 = _load_picamera2()
             
             # Check available cameras
             camera_manager = Picamera2._cm
@@ -66,11 +149,10 @@ class DeviceManager:
                     location = info.get('Location', '').lower()
                     
                     # Determine device type
-                    device_type = 'generic'
-                    if 'imx708' in model:
-                        device_type = 'imx708'
-                    elif 'imx500' in model:
-                        device_type = 'imx500'
+                    # Interned so the type compares by identity with the
+                    # registry keys it is later looked up in
+                    match = _MODEL_RE.search(model)
+                    device_type = sys.intern(match.group(1)) if match else 'generic'
                     
                     # Add to detected devices
                     device_name = f"camera{i}"
@@ -84,21 +166,26 @@ class DeviceManager:
             # Check for hardware accelerators
             self._detect_hardware_accelerators(detected)
             
+            self._detect_cache_ts = time.monotonic()
+            
         except Exception as e:
             logger.error(f"Error in device detection: {e}")
         
         self._detected_devices = detected
         return detected
     
+    def invalidate_detection(self):
+        """Forget the cached detection result, e.g. after a device is hot-plugged"""
+        self._detect_cache_ts = 0.0
+    
     def _detect_hardware_accelerators(self, detected: Dict[str, str]):
         """Detect hardware accelerators"""
+        from .hailo.hailo_device import _hailo_available
+        
         # Check for Hailo AI accelerator
-        try:
-            import hailopython
+        if _hailo_available():
             detected['hailo'] = 'hailo'
             logger.info("Detected Hailo AI accelerator")
-        except ImportError:
-            pass
     
     def initialize_device(self, device_name: str, device_type: str = None) -> Optional[BaseDevice]:
         """
@@ -109,8 +196,18 @@ class DeviceManager:
             device_type: Device type (if None, use detected type)
             
         Returns:
-            Initialized device or None if initialization failed
+            Initialized device or None if initialization failed, or if the
+            device is already initialized as a different type
         """
+        # Check if device is already initialized
+        if device_name in self._devices:
+            existing_type = self._device_type_of[device_name]
+            if device_type is None or device_type == existing_type:
+                return self._devices[device_name]
+            logger.error(f"Device '{device_name}' is already initialized as {existing_type}; "
+                         f"release it before initializing it as {device_type}")
+            return None
+        
         # Use detected type if not specified
         if device_type is None:
             if not self._detected_devices:
@@ -118,10 +215,6 @@ class DeviceManager:
             
             device_type = self._detected_devices.get(device_name, 'generic')
         
-        # Check if device is already initialized
-        if device_name in self._devices:
-            return self._devices[device_name]
-        
         try:
             # Create device based on type
             device_creator = self._device_types.get(device_type)
@@ -130,6 +223,7 @@ class DeviceManager:
                 device = device_creator(device_name)
                 if device and device.initialize():
                     self._devices[device_name] = device
+                    self._device_type_of[device_name] = device_type
                     return device
                 else:
                     logger.error(f"Failed to initialize {device_type} device '{device_name}'")
@@ -142,33 +236,6 @@ class DeviceManager:
             logger.error(f"Error initializing device '{device_name}': {e}")
             return None
     
-    def _create_imx708(self, device_name: str) -> BaseDevice:
-        """Create IMX708 device"""
-        try:
-            from .imx708_device import IMX708Device
-            return IMX708Device(device_name)
-        except ImportError:
-            logger.error(f"Failed to import IMX708Device")
-            return None
-    
-    def _create_imx500(self, device_name: str) -> BaseDevice:
-        """Create IMX500 device"""
-        try:
-            from .imx500_device import IMX500Device
-            return IMX500Device(device_name)
-        except ImportError:
-            logger.error(f"Failed to import IMX500Device")
-            return None
-    
-    def _create_hailo(self, device_name: str) -> BaseDevice:
-        """Create Hailo device"""
-        try:
-            from .hailo_device import HailoDevice
-            return HailoDevice(device_name)
-        except ImportError:
-            logger.error(f"Failed to import HailoDevice")
-            return None
-    
     def get_device(self, device_name: str) -> Optional[BaseDevice]:
         """
         Get initialized device
@@ -196,6 +263,7 @@ class DeviceManager:
             try:
                 if device.release():
                     del self._devices[device_name]
+                    del self._device_type_of[device_name]
                     return True
                 return False
             except Exception as e:
@@ -205,8 +273,15 @@ class DeviceManager:
     
     def release_all_devices(self):
         """Release all device resources"""
-        for device_name in list(self._devices.keys()):
-            self.release_device(device_name)
+        device_names = list(self._devices)
+        if not self.parallel_release or len(device_names) < 2:
+            for device_name in device_names:
+                self.release_device(device_name)
+            return
+        
+        # Devices have independent handles, so their (blocking) releases can overlap
+        with ThreadPoolExecutor(max_workers=min(RELEASE_WORKERS, len(device_names))) as executor:
+            list(executor.map(self.release_device, device_names))
     
     def get_available_device_types(self) -> List[str]:
         """
@@ -6,16 +6,19 @@ with embedded AI processing capabilities.
 """
 
 import logging
-from typing import Dict, Any, Optional, List, Tuple, Union
-import os
-import threading
+import types
+from pathlib import Path
+from typing import Dict, Any, Mapping, Optional
 import time
 
-from ..base_device import BaseDevice
+from ..base_device import BaseDevice, ModelInfo
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Result returned for frames that arrive before a model is loaded and enabled
+_NOT_READY_RESULT = types.MappingProxyType({'error': 'AI processing not ready'})
+
 
 class IMX500Device(BaseDevice):
     """
@@ -25,6 +28,23 @@ class IMX500Device(BaseDevice):
     vision sensor with embedded AI processing capabilities.
     """
     
+    # IMX500 capabilities, shared by all instances
+    _CAPABILITIES = frozenset({
+        'ai_processing',
+        'object_detection',
+        'classification',
+        'pose_estimation',
+        'segmentation'
+    })
+    
+    # Task type of each supported AI model
+    _MODEL_TYPES = {
+        'efficientdet': 'object_detection',
+        'yolov5': 'object_detection',
+        'highernet': 'pose_estimation',
+        'nanodet': 'object_detection',
+    }
+    
     def __init__(self, device_name: str, camera_properties: Dict[str, Any] = None):
         """
         Initialize IMX500 device
@@ -35,28 +55,26 @@ class IMX500Device(BaseDevice):
         """
         super().__init__(device_name, camera_properties)
         
-        # Set IMX500 capabilities
-        self._capabilities = {
-            'ai_processing',
-            'object_detection',
-            'classification',
-            'pose_estimation',
-            'segmentation'
-        }
-        
         # IMX500 specifications
         self._specs = {
             'resolution': (1920, 1080),
             'sensor_size': '1/2.84\"',
             'has_ai_processor': True,
             'max_framerate': 60,
-            'supported_models': ['efficientdet', 'yolov5', 'highernet', 'nanodet']
+            'supported_models': frozenset(self._MODEL_TYPES)
         }
+        # Read-only view handed out instead of copying the specs
+        self._specs_view = types.MappingProxyType(self._specs)
+        
+        # IMX500 library module, set by initialize()
+        self._imx500_lib = None
         
         # AI processing state
         self._model_loaded = False
         self._current_model = None
         self._processing_enabled = False
+        # Model loaded and processing enabled, checked once per frame
+        self._ready = False
         
         logger.debug(f"IMX500Device '{device_name}' initialized")
     
@@ -67,24 +85,21 @@ class IMX500Device(BaseDevice):
         Returns:
             bool: True if device initialized successfully
         """
-        try:
-            logger.info(f"Initializing IMX500 device '{self.name}'")
-            
-            # Initialize IMX500 specific libraries
-            try:
-                # Import IMX500 specific modules
-                from picamera2.devices.imx500 import imx500
-                self._imx500_lib = imx500
-            except ImportError as e:
-                logger.error(f"Failed to import IMX500 libraries: {e}")
-                return False
-            
-            super().initialize()
+        if self._initialized:
             return True
-            
-        except Exception as e:
-            logger.error(f"Failed to initialize IMX500 device: {e}")
+        
+        logger.info(f"Initializing IMX500 device '{self.name}'")
+        
+        # Initialize IMX500 specific libraries
+        try:
+            # Import IMX500 specific modules
+            from picamera2.devices.imx500 import imx500
+            self._imx500_lib = imx500
+        except ImportError as e:
+            logger.error(f"Failed to import IMX500 libraries: {e}")
             return False
+        
+        return super().initialize()
     
     def get_recommended_configuration(self) -> Dict[str, Any]:
         """
@@ -124,50 +139,20 @@ class IMX500Device(BaseDevice):
             logger.error(f"Unsupported model: {model_name}")
             return False
         
-        try:
-            logger.info(f"Loading {model_name} model")
-            
-            # Import and initialize model
-            if hasattr(self, '_imx500_lib'):
-                if model_name == 'efficientdet':
-                    self._current_model = {
-                        'name': 'efficientdet',
-                        'type': 'object_detection',
-                        'instance': None  # Would be initialized with actual model instance
-                    }
-                    self._model_loaded = True
-                    return True
-                elif model_name == 'yolov5':
-                    self._current_model = {
-                        'name': 'yolov5',
-                        'type': 'object_detection',
-                        'instance': None
-                    }
-                    self._model_loaded = True
-                    return True
-                elif model_name == 'highernet':
-                    self._current_model = {
-                        'name': 'highernet',
-                        'type': 'pose_estimation',
-                        'instance': None
-                    }
-                    self._model_loaded = True
-                    return True
-                elif model_name == 'nanodet':
-                    self._current_model = {
-                        'name': 'nanodet',
-                        'type': 'object_detection',
-                        'instance': None
-                    }
-                    self._model_loaded = True
-                    return True
-            
-            logger.error("IMX500 library not initialized")
-            return False
-            
-        except Exception as e:
-            logger.error(f"Failed to load model {model_name}: {e}")
-            return False
+        logger.info(f"Loading {model_name} model")
+        
+        # Import and initialize model
+        if self._imx500_lib is not None:
+            # The model instance would be created here and stored in ModelInfo.instance
+            self._current_model = ModelInfo(model_name, self._MODEL_TYPES[model_name],
+                                            path=Path(model_path) if model_path else None,
+                                            loaded_at=time.time())
+            self._model_loaded = True
+            self._ready = self._processing_enabled
+            return True
+        
+        logger.error("IMX500 library not initialized")
+        return False
     
     def enable_ai_processing(self, enable: bool = True) -> bool:
         """
@@ -185,13 +170,14 @@ class IMX500Device(BaseDevice):
         
         try:
             self._processing_enabled = enable
+            self._ready = enable and self._model_loaded
             logger.info(f"AI processing {'enabled' if enable else 'disabled'}")
             return True
         except Exception as e:
             logger.error(f"Failed to {'enable' if enable else 'disable'} AI processing: {e}")
             return False
     
-    def process_frame(self, frame) -> Dict[str, Any]:
+    def process_frame(self, frame, _time=time.time) -> Mapping[str, Any]:
         """
         Process a frame with loaded AI model
         
@@ -201,23 +187,18 @@ class IMX500Device(BaseDevice):
         Returns:
             Dict containing processing results
         """
-        if not self._model_loaded or not self._processing_enabled:
-            return {'error': 'AI processing not ready'}
+        if not self._ready:
+            return _NOT_READY_RESULT
         
-        try:
-            # This would be implemented to actually process the frame
-            # For now, we return a placeholder
-            results = {
-                'model': self._current_model['name'],
-                'type': self._current_model['type'],
-                'timestamp': time.time(),
-                'results': []
-            }
-            
-            return results
-        except Exception as e:
-            logger.error(f"Error processing frame: {e}")
-            return {'error': str(e)}
+        # This would be implemented to actually process the frame, with
+        # only the SDK call guarded. For now, we return a placeholder
+        model = self._current_model
+        return {
+            'model': model.name,
+            'type': model.type,
+            'timestamp': _time(),
+            'results': []
+        }
     
     def get_device_id(self) -> str:
         """
@@ -227,7 +208,7 @@ class IMX500Device(BaseDevice):
             Device ID string
         """
         try:
-            if hasattr(self, '_imx500_lib'):
+            if self._imx500_lib is not None:
                 # This would call the actual method to get device ID
                 return "IMX500-DEVICE-ID"
             return "UNKNOWN"
@@ -236,18 +217,16 @@ class IMX500Device(BaseDevice):
             return "ERROR"
     
     @property
-    def specs(self) -> Dict[str, Any]:
-        """Get IMX500 specifications"""
-        return self._specs.copy()
+    def specs(self) -> Mapping[str, Any]:
+        """Get IMX500 specifications (read-only view)"""
+        return self._specs_view
     
     @property
     def is_processing_enabled(self) -> bool:
         """Check if AI processing is enabled"""
-        return self._processing_enabled and self._model_loaded
+        return self._ready
     
     @property
-    def current_model(self) -> Optional[Dict[str, Any]]:
+    def current_model(self) -> Optional[ModelInfo]:
         """Get current AI model information"""
-        if self._model_loaded:
-            return self._current_model.copy()
-        return None
+        return self._current_model
@@ -5,8 +5,10 @@ This module provides support for the Sony IMX708 camera module
 used in Raspberry Pi Camera Module 3.
 """
 
+import copy
 import logging
-from typing import Dict, Any, Optional, List, Tuple
+import types
+from typing import Dict, Any, Mapping, Optional, List, Tuple
 import os
 
 from ..base_device import BaseDevice
@@ -14,6 +16,67 @@ from ..base_device import BaseDevice
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Full sensor resolution of the IMX708
+SENSOR_RESOLUTION = (4608, 2592)
+
+
+def _with_overrides(config: Dict[str, Any], **sections: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a configuration and update the given sections of the copy"""
+    config = copy.deepcopy(config)
+    for section, values in sections.items():
+        config[section].update(values)
+    return config
+
+
+# Recommended configuration; the other configurations override parts of it
+_RECOMMENDED_CONFIG = {
+    'main': {
+        'size': (2304, 1296),
+        'format': 'RGB888'
+    },
+    'lores': {
+        'size': (640, 360),
+        'format': 'YUV420'
+    },
+    'controls': {
+        'FrameRate': 30.0,
+        'AwbEnable': True,
+        'AeEnable': True,
+        'ExposureTime': 20000,  # 20ms
+        'AnalogueGain': 1.0
+    }
+}
+
+# The configurations are fixed per sensor, so they are built once at import
+_CONFIGS = {
+    'recommended': _RECOMMENDED_CONFIG,
+    'hdr': _with_overrides(_RECOMMENDED_CONFIG, controls={
+        'AwbEnable': True,
+        'AeEnable': True,
+        'NoiseReductionMode': 'HighQuality',
+        'FrameRate': 24.0
+    }),
+    'low_light': _with_overrides(_RECOMMENDED_CONFIG, controls={
+        'AwbEnable': True,
+        'AeEnable': True,
+        'ExposureTime': 66666,  # 1/15s
+        'AnalogueGain': 8.0,
+        'NoiseReductionMode': 'HighQuality'
+    }),
+    'max_resolution': _with_overrides(
+        _RECOMMENDED_CONFIG,
+        main={'size': SENSOR_RESOLUTION},
+        lores={'size': (640, 360)},
+        controls={'FrameRate': 15.0}  # Lower framerate for max resolution
+    ),
+}
+
+
+
+def _get_config(name: str) -> Dict[str, Any]:
+    """Return a copy of a configuration that the caller may modify"""
+    return copy.deepcopy(_CONFIGS[name])
+
 
 class IMX708Device(BaseDevice):
     """
@@ -23,6 +86,15 @@ class IMX708Device(BaseDevice):
     module used in the Raspberry Pi Camera Module 3.
     """
     
+    # IMX708 capabilities, shared by all instances
+    _CAPABILITIES = frozenset({
+        'hdr',
+        'raw',
+        'high_resolution',
+        'autofocus',
+        'wide_dynamic_range'
+    })
+    
     def __init__(self, device_name: str, camera_properties: Dict[str, Any] = None):
         """
         Initialize IMX708 device
@@ -33,24 +105,17 @@ class IMX708Device(BaseDevice):
         """
         super().__init__(device_name, camera_properties)
         
-        # Set IMX708 capabilities
-        self._capabilities = {
-            'hdr',
-            'raw',
-            'high_resolution',
-            'autofocus',
-            'wide_dynamic_range'
-        }
-        
         # IMX708 specifications
         self._specs = {
-            'resolution': (4608, 2592),
+            'resolution': SENSOR_RESOLUTION,
             'sensor_size': '1/2.3\"',
             'pixel_size': 1.4,  # microns
             'max_framerate': 120,
             'lens_fov': 66,  # diagonal FOV in degrees
             'max_raw_bits': 12
         }
+        # Read-only view handed out instead of copying the specs
+        self._specs_view = types.MappingProxyType(self._specs)
         
         logger.debug(f"IMX708Device '{device_name}' initialized")
     
@@ -61,17 +126,14 @@ class IMX708Device(BaseDevice):
         Returns:
             bool: True if device initialized successfully
         """
-        try:
-            logger.info(f"Initializing IMX708 device '{self.name}'")
-            
-            # Initialize IMX708-specific functionality
-            # For now, this just sets initialized flag
-            super().initialize()
-            
+        if self._initialized:
             return True
-        except Exception as e:
-            logger.error(f"Failed to initialize IMX708 device: {e}")
-            return False
+        
+        logger.info(f"Initializing IMX708 device '{self.name}'")
+        
+        # Initialize IMX708-specific functionality
+        # For now, this just sets initialized flag
+        return super().initialize()
     
     def get_recommended_configuration(self) -> Dict[str, Any]:
         """
@@ -80,23 +142,7 @@ class IMX708Device(BaseDevice):
         Returns:
             Dict containing recommended camera configuration
         """
-        return {
-            'main': {
-                'size': (2304, 1296),
-                'format': 'RGB888'
-            },
-            'lores': {
-                'size': (640, 360),
-                'format': 'YUV420'
-            },
-            'controls': {
-                'FrameRate': 30.0,
-                'AwbEnable': True,
-                'AeEnable': True,
-                'ExposureTime': 20000,  # 20ms
-                'AnalogueGain': 1.0
-            }
-        }
+        return _get_config('recommended')
     
     def get_hdr_configuration(self) -> Dict[str, Any]:
         """
@@ -105,17 +151,7 @@ class IMX708Device(BaseDevice):
         Returns:
             Dict containing HDR camera configuration
         """
-        config = self.get_recommended_configuration()
-        
-        # Update for HDR mode
-        config['controls'].update({
-            'AwbEnable': True,
-            'AeEnable': True,
-            'NoiseReductionMode': 'HighQuality',
-            'FrameRate': 24.0
-        })
-        
-        return config
+        return _get_config('hdr')
     
     def get_low_light_configuration(self) -> Dict[str, Any]:
         """
@@ -124,18 +160,7 @@ class IMX708Device(BaseDevice):
         Returns:
             Dict containing low-light camera configuration
         """
-        config = self.get_recommended_configuration()
-        
-        # Update for low-light conditions
-        config['controls'].update({
-            'AwbEnable': True,
-            'AeEnable': True,
-            'ExposureTime': 66666,  # 1/15s
-            'AnalogueGain': 8.0,
-            'NoiseReductionMode': 'HighQuality'
-        })
-        
-        return config
+        return _get_config('low_light')
     
     def get_max_resolution_configuration(self) -> Dict[str, Any]:
         """
@@ -144,16 +169,9 @@ class IMX708Device(BaseDevice):
         Returns:
             Dict containing max resolution camera configuration
         """
-        config = self.get_recommended_configuration()
-        
-        # Update for maximum resolution
-        config['main']['size'] = self._specs['resolution']
-        config['lores']['size'] = (640, 360)
-        config['controls']['FrameRate'] = 15.0  # Lower framerate for max resolution
-        
-        return config
+        return _get_config('max_resolution')
     
     @property
-    def specs(self) -> Dict[str, Any]:
-        """Get IMX708 specifications"""
-        return self._specs.copy()
+    def specs(self) -> Mapping[str, Any]:
+        """Get IMX708 specifications (read-only view)"""
+        return self._specs_view
@@ -15,6 +15,26 @@ import time
 import numpy as np
 from PIL import Image
 
+try:
+    # OpenCV writes numpy arrays directly, without a copy into a PIL image
+    import cv2
+except ImportError:
+    cv2 = None
+
+try:
+    # libjpeg-turbo uses NEON on the Pi and encodes much faster than Pillow;
+    # one instance is shared by every encode
+    from turbojpeg import TurboJPEG, TJPF_RGB
+    tj = TurboJPEG()
+except (ImportError, OSError, RuntimeError):
+    tj = None
+
+def encode_jpeg(array, quality=95):
+    """Encode an image array as JPEG, using libjpeg-turbo when available."""
+    if tj is not None and array.ndim == 3 and array.shape[2] == 3:
+        return tj.encode(np.ascontiguousarray(array), quality=quality, pixel_format=TJPF_RGB)
+    return ImageUtils.array_to_jpeg(array, quality)
+
 def main():
     # Create output directory
     output_dir = "advanced_captures"
@@ -36,7 +56,7 @@ def main():
         print("\n1. Capturing JPEG with timestamp...")
         image = camera.capture.capture_image(format='array')
         timestamped = ImageUtils.add_timestamp(image)
-        jpeg_data = ImageUtils.array_to_jpeg(timestamped)
+        jpeg_data = encode_jpeg(timestamped)
         
         with open(os.path.join(output_dir, "timestamped.jpg"), 'wb') as f:
             f.write(jpeg_data)
@@ -47,8 +67,11 @@ def main():
             raw_image = camera.capture.capture_raw()
             # Convert to viewable format and save as PNG
             if raw_image is not None and isinstance(raw_image, np.ndarray):
-                img = Image.fromarray(raw_image)
-                img.save(os.path.join(output_dir, "raw_capture.png"))
+                raw_path = os.path.join(output_dir, "raw_capture.png")
+                if cv2 is not None:
+                    cv2.imwrite(raw_path, raw_image)
+                else:
+                    Image.fromarray(raw_image).save(raw_path)
                 print("   RAW capture saved as PNG")
             else:
                 print("   RAW capture not supported on this device")
@@ -75,7 +98,7 @@ def main():
         image = camera.capture.capture_image(format='array')
         overlay_text = "PiCamera2 Restructured"
         with_text = ImageUtils.add_overlay_text(image, overlay_text)
-        jpeg_data = ImageUtils.array_to_jpeg(with_text)
+        jpeg_data = encode_jpeg(with_text)
         
         with open(os.path.join(output_dir, "overlay_text.jpg"), 'wb') as f:
             f.write(jpeg_data)
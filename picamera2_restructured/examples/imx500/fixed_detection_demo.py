@@ -50,6 +50,40 @@ try:
 except ImportError:
     print("Warning: Could not import some IMX500 modules")
 
+# Numba is optional; without it the NumPy path is used
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+@njit(cache=True, fastmath=True)
+def _filter_boxes(boxes, scores, classes, threshold, input_h, normalize):
+    """Normalize and threshold raw detections in one compiled pass, returning compact kept arrays."""
+    count = 0
+    for i in range(scores.shape[0]):
+        if scores[i] > threshold:
+            count += 1
+
+    boxes_out = np.empty((count, 4), dtype=np.float32)
+    scores_out = np.empty(count, dtype=np.float32)
+    classes_out = np.empty(count, dtype=np.int32)
+    j = 0
+    for i in range(scores.shape[0]):
+        if scores[i] > threshold:
+            for k in range(4):
+                boxes_out[j, k] = boxes[i, k] / input_h if normalize else boxes[i, k]
+            scores_out[j] = scores[i]
+            classes_out[j] = np.int32(classes[i])
+            j += 1
+    return boxes_out, scores_out, classes_out
+
+# Requests or results waiting between pipeline stages; older ones are dropped
+QUEUE_SIZE = 2
+
 # Detection class matching the original implementation
 class Detection:
     def __init__(self, coords, category, conf, metadata, imx500_device, camera):
@@ -58,6 +92,27 @@ class Detection:
         self.conf = conf
         self.box = imx500_device.convert_inference_coords(coords, metadata, camera)
 
+    @classmethod
+    def from_xywh(cls, box, category, conf):
+        """Create a Detection from a box already converted to ISP output (x, y, w, h)."""
+        detection = cls.__new__(cls)
+        detection.category = category
+        detection.conf = conf
+        detection.box = box
+        return detection
+
+def convert_boxes(boxes, metadata, imx500_device, camera):
+    """Convert (N, 4) inference boxes to an (N, 4) array of ISP output (x, y, w, h) boxes.
+
+    The scaling lives in IMX500.convert_inference_coords, which takes one box at
+    a time; the results are gathered into a single array for the caller.
+    """
+    convert = imx500_device.convert_inference_coords
+    converted = np.empty((len(boxes), 4), dtype=np.int32)
+    for i in range(len(boxes)):
+        converted[i] = convert(boxes[i], metadata, camera)
+    return converted
+
 def parse_args():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(description="Fixed IMX500 Object Detection Demo")
@@ -86,6 +141,9 @@ def parse_detections(metadata, imx500_device, camera, args, intrinsics):
     
     if np_outputs is None:
         return None
+
+    # Set once boxes, scores and classes hold only the boxes above the threshold
+    filtered = False
         
     # Handle different postprocessing methods
     postprocess_type = args.postprocess
@@ -111,17 +169,32 @@ def parse_detections(metadata, imx500_device, camera, args, intrinsics):
     else:
         # Standard processing
         boxes, scores, classes = np_outputs[0][0], np_outputs[1][0], np_outputs[2][0]
-        if bbox_normalization:
-            boxes = boxes / input_h
-
-        boxes = np.array_split(boxes, 4, axis=1)
-        boxes = list(zip(*boxes))
-
-    # Create detection objects exactly like the original implementation
+        if NUMBA_AVAILABLE:
+            # Compiled single pass over the raw outputs; only kept boxes come back
+            boxes, scores, classes = _filter_boxes(
+                np.ascontiguousarray(boxes, dtype=np.float32),
+                np.ascontiguousarray(scores, dtype=np.float32),
+                np.ascontiguousarray(classes),
+                np.float32(threshold), np.float32(input_h), bool(bbox_normalization))
+            filtered = True
+        else:
+            # Keep boxes as one contiguous (N, 4) array; each row is a box
+            boxes = np.ascontiguousarray(boxes, dtype=np.float32)
+            if bbox_normalization:
+                boxes /= input_h
+
+    if not filtered:
+        # Filter by score first so coordinates are only converted for kept boxes
+        scores = np.asarray(scores)
+        keep_idx = np.flatnonzero(scores > threshold)
+        boxes, scores = np.asarray(boxes)[keep_idx], scores[keep_idx]
+        classes = np.asarray(classes)[keep_idx].astype(np.int32, copy=False)
+
+    # Convert the kept boxes in one pass, then build the detection objects
+    converted = convert_boxes(boxes, metadata, imx500_device, camera)
     detections = [
-        Detection(box, category, score, metadata, imx500_device, camera)
-        for box, score, category in zip(boxes, scores, classes)
-        if score > threshold
+        Detection.from_xywh(box, category, score)
+        for box, category, score in zip(converted.tolist(), classes.tolist(), scores.tolist())
     ]
     
     return detections
@@ -133,82 +206,109 @@ def get_labels(labels_tuple, ignore_dash_labels=False):
         return [label for label in labels_tuple if label and label != "-"]
     return list(labels_tuple)
 
+@lru_cache(maxsize=1024)
+def get_text_size(label):
+    """Get cached text size of a label in the overlay font (labels repeat across frames)."""
+    return cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, 0.5, 1)
+
 def draw_detections(frame, detections, labels):
-    """Draw detections on a regular frame (not a request)."""
+    """Draw detections directly onto a regular frame (not a request) and return it.
+
+    The frame is modified in place, so pass a copy if the original is still needed.
+    """
     if not detections:
         return frame
-        
-    # Make a copy of the frame
-    result = frame.copy()
     
     for detection in detections:
         x, y, w, h = detection.box
         label = f"{labels[int(detection.category)]} ({detection.conf:.2f})"
 
         # Calculate text size and position
-        (text_width, text_height), baseline = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, 0.5, 1)
+        (text_width, text_height), baseline = get_text_size(label)
         text_x = x + 5
         text_y = y + 15
 
         # Draw background rectangle for text
-        cv2.rectangle(result,
+        cv2.rectangle(frame,
                       (text_x, text_y - text_height),
                       (text_x + text_width, text_y + baseline),
                       (0, 0, 0), -1)  # Black background
 
         # Draw text
-        cv2.putText(result, label, (text_x, text_y),
+        cv2.putText(frame, label, (text_x, text_y),
                     cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 255), 1)  # Yellow text
 
         # Draw detection box
-        cv2.rectangle(result, (x, y), (x + w, y + h), (0, 255, 0), thickness=2)
+        cv2.rectangle(frame, (x, y), (x + w, y + h), (0, 255, 0), thickness=2)
 
-    return result
+    return frame
 
-def draw_detections_on_request(request, detections, labels, preserve_aspect_ratio=False, imx500_device=None):
-    """Draw the detections for this request onto the ISP output."""
-    if not detections:
-        return
-        
-    with MappedArray(request, 'main') as m:
-        for detection in detections:
-            x, y, w, h = detection.box
-            label = f"{labels[int(detection.category)]} ({detection.conf:.2f})"
+def draw_detections_on_array(array, detections, labels, roi=None):
+    """Draw detections, and the ROI rectangle if given, onto a mapped ISP output array."""
+    for detection in detections:
+        x, y, w, h = detection.box
+        label = f"{labels[int(detection.category)]} ({detection.conf:.2f})"
 
-            # Calculate text size and position
-            (text_width, text_height), baseline = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, 0.5, 1)
-            text_x = x + 5
-            text_y = y + 15
+        # Calculate text size and position
+        (text_width, text_height), baseline = get_text_size(label)
+        text_x = x + 5
+        text_y = y + 15
 
-            # Create a copy of the array to draw the background with opacity
-            overlay = m.array.copy()
+        # Blend a white background into just the label area, clipped
+        # to the frame, instead of blending a copy of the whole frame
+        x0 = max(text_x, 0)
+        y0 = max(text_y - text_height, 0)
+        x1 = min(text_x + text_width + 1, array.shape[1])
+        y1 = min(text_y + baseline + 1, array.shape[0])
+        if x1 > x0 and y1 > y0:
+            label_bg = array[y0:y1, x0:x1]
+            alpha = 0.3
+            cv2.addWeighted(np.full_like(label_bg, 255), alpha, label_bg, 1 - alpha, 0, dst=label_bg)
 
-            # Draw the background rectangle on the overlay
-            cv2.rectangle(overlay,
-                          (text_x, text_y - text_height),
-                          (text_x + text_width, text_y + baseline),
-                          (255, 255, 255),  # Background color (white)
-                          cv2.FILLED)
+        # Draw text on top of the background
+        cv2.putText(array, label, (text_x, text_y),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 0, 255), 1)
 
-            alpha = 0.3
-            cv2.addWeighted(overlay, alpha, m.array, 1 - alpha, 0, m.array)
+        # Draw detection box
+        cv2.rectangle(array, (x, y), (x + w, y + h), (0, 255, 0), thickness=2)
+
+    if roi is not None:
+        b_x, b_y, b_w, b_h = roi
+        color = (255, 0, 0)  # red
+        cv2.putText(array, "ROI", (b_x + 5, b_y + 15), cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 1)
+        cv2.rectangle(array, (b_x, b_y), (b_x + b_w, b_y + b_h), (255, 0, 0, 0))
 
-            # Draw text on top of the background
-            cv2.putText(m.array, label, (text_x, text_y),
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 0, 255), 1)
+def draw_detections_on_request(request, detections, labels, preserve_aspect_ratio=False, imx500_device=None):
+    """Draw the detections for this request onto the ISP output, mapping it once."""
+    if not detections:
+        return
+
+    # Look up the ROI if preserve_aspect_ratio is enabled
+    roi = None
+    if preserve_aspect_ratio and imx500_device:
+        try:
+            roi = imx500_device.get_roi_scaled(request)
+        except Exception as e:
+            print(f"Error drawing ROI: {e}")
 
-            # Draw detection box
-            cv2.rectangle(m.array, (x, y), (x + w, y + h), (0, 255, 0), thickness=2)
+    with MappedArray(request, 'main') as m:
+        draw_detections_on_array(m.array, detections, labels, roi)
 
-        # Draw ROI if preserve_aspect_ratio is enabled
-        if preserve_aspect_ratio and imx500_device:
+def put_latest(q, item):
+    """Put an item on a bounded queue, dropping and releasing the oldest entries while it is full."""
+    while True:
+        try:
+            q.put_nowait(item)
+            return
+        except queue.Full:
             try:
-                b_x, b_y, b_w, b_h = imx500_device.get_roi_scaled(request)
-                color = (255, 0, 0)  # red
-                cv2.putText(m.array, "ROI", (b_x + 5, b_y + 15), cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 1)
-                cv2.rectangle(m.array, (b_x, b_y), (b_x + b_w, b_y + b_h), (255, 0, 0, 0))
-            except Exception as e:
-                print(f"Error drawing ROI: {e}")
+                dropped = q.get_nowait()
+            except queue.Empty:
+                continue
+            # Queued items are requests or (request, detections) pairs
+            request = dropped[0] if isinstance(dropped, tuple) else dropped
+            if request is not None:
+                request.release()
 
 def detection_worker(jobs_queue, results_queue, imx500_device, camera, args, intrinsics, stop_event):
     """Worker thread for handling detections."""
@@ -230,7 +330,7 @@ def detection_worker(jobs_queue, results_queue, imx500_device, camera, args, int
                 detections = parse_detections(metadata, imx500_device, camera, args, intrinsics)
                 
                 # Put results in the queue
-                results_queue.put((request, detections))
+                put_latest(results_queue, (request, detections))
             else:
                 # No metadata, release the request
                 request.release()
@@ -240,46 +340,6 @@ def detection_worker(jobs_queue, results_queue, imx500_device, camera, args, int
             import traceback
             traceback.print_exc()
 
-def display_worker(results_queue, stop_event, imx500_device, args, labels):
-    """Worker thread for displaying results."""
-    last_detections = []
-    
-    while not stop_event.is_set():
-        try:
-            # Get the next result to display
-            try:
-                request, detections = results_queue.get(timeout=0.5)
-            except queue.Empty:
-                continue
-                
-            # Use last detections if current ones are None
-            if detections is None:
-                detections = last_detections
-            else:
-                last_detections = detections
-                
-            # Draw detections directly on the request
-            draw_detections_on_request(
-                request, 
-                detections, 
-                labels, 
-                preserve_aspect_ratio=args.preserve_aspect_ratio,
-                imx500_device=imx500_device
-            )
-            
-            # Display the image
-            with MappedArray(request, 'main') as m:
-                cv2.imshow('IMX500 Object Detection', m.array)
-                cv2.waitKey(1)
-            
-            # Release the request
-            request.release()
-            
-        except Exception as e:
-            print(f"Error in display worker: {e}")
-            import traceback
-            traceback.print_exc()
-
 def main():
     # Parse arguments
     args = parse_args()
@@ -361,11 +421,14 @@ def main():
         imx500.set_auto_aspect_ratio()
     
     # Create queues for communication
-    jobs_queue = queue.Queue()
-    results_queue = queue.Queue()
+    # Bounded so that a slow detector skips frames instead of holding on to
+    # all of the camera's buffers and stalling capture
+    jobs_queue = queue.Queue(maxsize=QUEUE_SIZE)
+    results_queue = queue.Queue(maxsize=QUEUE_SIZE)
     stop_event = threading.Event()
     
-    # Create and start workers
+    # Create and start the detection worker; the main loop below is the only
+    # consumer of its results
     detection_thread = threading.Thread(
         target=detection_worker,
         args=(jobs_queue, results_queue, imx500, picam2, args, intrinsics, stop_event),
@@ -373,45 +436,44 @@ def main():
     )
     detection_thread.start()
     
-    display_thread = threading.Thread(
-        target=display_worker,
-        args=(results_queue, stop_event, imx500, args, labels),
-        daemon=True
-    )
-    display_thread.start()
-    
     # Create a window immediately to show we're working
     cv2.namedWindow('IMX500 Object Detection', cv2.WINDOW_NORMAL)
     
     try:
         print("Detection running. Press Ctrl+C to stop.")
         last_detections = []
+        # Display frame reused across iterations, allocated on the first frame
+        display_buf = None
         
         while True:
             # Capture a request
             request = picam2.capture_request()
             
-            # Put the request in the jobs queue for detection
-            jobs_queue.put(request)
-            
             # Also display the raw frame immediately for responsiveness
-            # This ensures we always see video even if detection is slow
+            # This ensures we always see video even if detection is slow.
+            # Copy it before queueing, as the detection worker may release the request
             with MappedArray(request, 'main') as m:
-                # Make a copy for display
-                frame = m.array.copy()
+                # Copy into the display buffer so drawing leaves the request untouched
+                if display_buf is None or display_buf.shape != m.array.shape:
+                    display_buf = np.empty_like(m.array)
+                np.copyto(display_buf, m.array)
+            
+            # Put the request in the jobs queue for detection
+            put_latest(jobs_queue, request)
             
             # Draw any previous detections we have
             if last_detections:
-                frame = draw_detections(frame, last_detections, labels)
+                draw_detections(display_buf, last_detections, labels)
             
             # Show the frame immediately
-            cv2.imshow('IMX500 Object Detection', frame)
+            cv2.imshow('IMX500 Object Detection', display_buf)
             if cv2.waitKey(1) & 0xFF == ord('q'):
                 break
             
             # Update last detections if we have new ones
             try:
-                _, detections = results_queue.get_nowait()
+                result_request, detections = results_queue.get_nowait()
+                result_request.release()
                 if detections:
                     last_detections = detections
             except queue.Empty:
@@ -420,13 +482,12 @@ def main():
     except KeyboardInterrupt:
         print("\nStopping...")
     finally:
-        # Stop workers
+        # Stop the worker
         stop_event.set()
-        jobs_queue.put(None)  # Signal to stop
+        put_latest(jobs_queue, None)  # Signal to stop
         
-        # Wait for workers to finish
+        # Wait for the worker to finish
         detection_thread.join(timeout=1.0)
-        display_thread.join(timeout=1.0)
         
         # Clean up
         cv2.destroyAllWindows()
@@ -362,6 +362,14 @@ class ImageUtils:
         else:
             image_array = image
         
+        # 8-bit values index their bins directly, so count them instead of binning
+        if bins == 256 and image_array.dtype == np.uint8:
+            if image_array.ndim == 2:
+                return {'gray': np.bincount(image_array.ravel(), minlength=256)}
+            if image_array.ndim == 3 and image_array.shape[2] == 3:
+                return {name: np.bincount(image_array[:, :, c].ravel(), minlength=256)
+                        for c, name in enumerate(('r', 'g', 'b'))}
+        
         # Determine image type and calculate histogram
         if len(image_array.shape) == 2:
             # Grayscale image